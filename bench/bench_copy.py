@@ -0,0 +1,94 @@
+"""
+Deep copies of ADT values, compared with the generic `deepcopy` of the same
+values and with deep copies of plain dataclasses.
+"""
+from __future__ import annotations
+
+import copy
+
+from dataclasses import dataclass
+
+import pytest
+
+from adt import ADT
+
+
+DEPTH = 14
+
+
+class Tree(ADT):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: int
+        left: Tree
+        right: Tree
+
+
+class Frozen(ADT):
+    EMPTY = "empty"
+
+    @dataclass(frozen=True)
+    class Node:
+        val: int
+        left: Frozen
+        right: Frozen
+
+
+@dataclass
+class Node:
+    val: int
+    left: Node | None
+    right: Node | None
+
+
+def build(depth: int) -> Tree:
+    if depth == 0:
+        return Tree.EMPTY
+    return Tree.Node(depth, build(depth - 1), build(depth - 1))
+
+
+def build_frozen(depth: int) -> Frozen:
+    if depth == 0:
+        return Frozen.EMPTY
+    return Frozen.Node(depth, build_frozen(depth - 1), build_frozen(depth - 1))
+
+
+def build_plain(depth: int) -> Node | None:
+    if depth == 0:
+        return None
+    return Node(depth, build_plain(depth - 1), build_plain(depth - 1))
+
+
+@pytest.fixture
+def generic_deepcopy():
+    """Remove the copy hooks of the ADTs, so `deepcopy` uses `__reduce_ex__`."""
+    removed = []
+    for cls in (ADT, Tree.Node, Frozen.Node):
+        for name in ("__copy__", "__deepcopy__"):
+            removed.append((cls, name, cls.__dict__[name]))
+            delattr(cls, name)
+    yield
+    for cls, name, method in removed:
+        setattr(cls, name, method)
+
+
+def test_deepcopy(benchmark_peak):
+    benchmark_peak(copy.deepcopy, build(DEPTH))
+
+
+def test_deepcopy_frozen(benchmark_peak):
+    benchmark_peak(copy.deepcopy, build_frozen(DEPTH))
+
+
+def test_deepcopy_plain(benchmark_peak):
+    benchmark_peak(copy.deepcopy, build_plain(DEPTH))
+
+
+def test_deepcopy_generic(benchmark_peak, generic_deepcopy):
+    benchmark_peak(copy.deepcopy, build(DEPTH))
+
+
+def test_deepcopy_frozen_generic(benchmark_peak, generic_deepcopy):
+    benchmark_peak(copy.deepcopy, build_frozen(DEPTH))
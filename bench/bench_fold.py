@@ -0,0 +1,57 @@
+"""Folding a large tree, sequentially and with increasing worker counts."""
+from __future__ import annotations
+
+import os
+
+from dataclasses import dataclass
+from operator import add
+
+import pytest
+
+from adt import ADT, fold, parallel_fold
+
+
+DEPTH = 16
+WORKERS = [1, 2, 4, 8]
+
+
+class Tree(ADT):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: int
+        left: Tree
+        right: Tree
+
+
+def build(depth: int, val: int = 0) -> Tree:
+    if depth == 0:
+        return Tree.EMPTY
+    return Tree.Node(val, build(depth - 1, 2 * val), build(depth - 1, 2 * val + 1))
+
+
+def work(node: Tree) -> int:
+    # enough work per value for the parallel speedup to show
+    if node is Tree.EMPTY:
+        return 0
+    h = node.val
+    for _ in range(200):
+        h = (h * 31 + 7) % 1_000_003
+    return h
+
+
+def test_fold(benchmark):
+    tree = build(DEPTH)
+    benchmark(fold, tree, work, add)
+
+
+@pytest.mark.parametrize("workers", WORKERS)
+def test_parallel_fold(benchmark, workers):
+    tree = build(DEPTH)
+    benchmark.extra_info["workers"] = workers
+    # speedups are only meaningful with at least as many CPUs as workers
+    benchmark.extra_info["cpus"] = os.cpu_count()
+    benchmark.pedantic(
+        parallel_fold, (tree, work, add), {"max_workers": workers}, rounds=3
+    )
@@ -0,0 +1,65 @@
+"""Building and partially exploring lazy versus eager trees."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from adt import ADT, Thunk, lazy
+
+
+DEPTH = 16
+
+
+class Eager(ADT):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: int
+        left: Eager
+        right: Eager
+
+
+class Lazy(ADT):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: int
+        left: Lazy = lazy()
+        right: Lazy = lazy()
+
+
+def eager(depth: int, val: int = 1) -> Eager:
+    if depth == 0:
+        return Eager.EMPTY
+    return Eager.Node(val, eager(depth - 1, 2 * val), eager(depth - 1, 2 * val + 1))
+
+
+def deferred(depth: int, val: int = 1) -> Lazy:
+    if depth == 0:
+        return Lazy.EMPTY
+    return Lazy.Node(
+        val,
+        Thunk(lambda: deferred(depth - 1, 2 * val)),
+        Thunk(lambda: deferred(depth - 1, 2 * val + 1)),
+    )
+
+
+def leftmost(tree) -> int:
+    val = 0
+    while tree.__class__ is not Eager and tree.__class__ is not Lazy:
+        val = tree.val
+        tree = tree.left
+    return val
+
+
+def build_and_explore(build):
+    return leftmost(build(DEPTH))
+
+
+def test_eager(benchmark_peak):
+    benchmark_peak(build_and_explore, eager)
+
+
+def test_lazy(benchmark_peak):
+    benchmark_peak(build_and_explore, deferred)
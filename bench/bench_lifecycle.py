@@ -0,0 +1,227 @@
+"""The ADT lifecycle, compared with enums and plain dataclasses."""
+from __future__ import annotations
+
+import pickle
+
+from dataclasses import dataclass, make_dataclass
+from enum import Enum
+
+import pytest
+
+from adt import ADT
+
+
+COUNTS = [10, 100, 1000]
+VALUES = 1_000
+NODES = 100_000
+
+
+class Shape(ADT):
+    ORIGIN = "origin"
+    UNHASHABLE = ["unhashable"]
+
+    @dataclass
+    class Circle:
+        r: float
+
+    @dataclass
+    class Rect:
+        w: float
+        h: float
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+
+
+@dataclass
+class Circle:
+    r: float
+
+
+@dataclass
+class Rect:
+    w: float
+    h: float
+
+
+class Tree(ADT):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: int
+        left: Tree
+        right: Tree
+
+
+@dataclass
+class Node:
+    val: int
+    left: Node | None
+    right: Node | None
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_create_constants(benchmark_peak, count):
+    benchmark_peak(ADT, "Constants", [(f"M{i}", i) for i in range(count)])
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_create_constants_enum(benchmark_peak, count):
+    benchmark_peak(Enum, "Constants", [(f"M{i}", i) for i in range(count)])
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_create_classes(benchmark_peak, count):
+    members = [(f"C{i}", make_dataclass(f"C{i}", [("x", int)])) for i in range(count)]
+    benchmark_peak(ADT, "Classes", members)
+
+
+def test_construct(benchmark):
+    benchmark(Shape.Rect, 1.0, 2.0)
+
+
+def test_construct_dataclass(benchmark):
+    benchmark(Rect, 1.0, 2.0)
+
+
+def test_lookup_hashable(benchmark):
+    benchmark(Shape, "origin")
+
+
+def test_lookup_unhashable(benchmark):
+    benchmark(Shape, ["unhashable"])
+
+
+def test_lookup_enum(benchmark):
+    benchmark(Color, 1)
+
+
+# isinstance(Shape.ORIGIN, Shape) never reaches ADTMeta.__instancecheck__, as
+# CPython handles exact type matches itself; checking a constant against ADT
+# exercises the fallback instead
+@pytest.mark.parametrize(
+    ("value", "cls"),
+    [(Shape.Circle(1.0), Shape), (Shape.ORIGIN, ADT), (Circle(1.0), Shape)],
+    ids=["member-hit", "constant-fallback", "miss"],
+)
+def test_isinstance(benchmark, value, cls):
+    benchmark(isinstance, value, cls)
+
+
+@pytest.mark.parametrize("value", [Color.RED, Circle(1.0)], ids=["hit", "miss"])
+def test_isinstance_enum(benchmark, value):
+    benchmark(isinstance, value, Color)
+
+
+def test_isinstance_dataclass(benchmark):
+    benchmark(isinstance, Circle(1.0), Circle)
+
+
+def area(shape: Shape) -> float:
+    match shape:
+        case Shape.ORIGIN | Shape.UNHASHABLE:
+            return 0.0
+        case Shape.Circle(r):
+            return 3.14 * r * r
+        case Shape.Rect(w, h):
+            return w * h
+
+
+def area_plain(shape: Color | Circle | Rect) -> float:
+    match shape:
+        case Color.RED | Color.GREEN | Color.BLUE:
+            return 0.0
+        case Circle(r):
+            return 3.14 * r * r
+        case Rect(w, h):
+            return w * h
+
+
+def shapes() -> list[Shape]:
+    members = [Shape.ORIGIN, Shape.UNHASHABLE, Shape.Circle(1.0), Shape.Rect(1.0, 2.0)]
+    return [members[i % len(members)] for i in range(VALUES)]
+
+
+def plain_shapes() -> list[Color | Circle | Rect]:
+    members = [Color.RED, Color.BLUE, Circle(1.0), Rect(1.0, 2.0)]
+    return [members[i % len(members)] for i in range(VALUES)]
+
+
+def test_match(benchmark):
+    values = shapes()
+    benchmark(lambda: [area(v) for v in values])
+
+
+def test_match_plain(benchmark):
+    values = plain_shapes()
+    benchmark(lambda: [area_plain(v) for v in values])
+
+
+def round_trip(values):
+    return pickle.loads(pickle.dumps(values))
+
+
+def test_pickle(benchmark_peak):
+    benchmark_peak(round_trip, shapes())
+
+
+def test_pickle_plain(benchmark_peak):
+    benchmark_peak(round_trip, plain_shapes())
+
+
+def build_tree(n: int) -> Tree:
+    tree = Tree.EMPTY
+    for i in range(n):
+        tree = Tree.Node(i, tree, Tree.EMPTY)
+    return tree
+
+
+def build_plain_tree(n: int) -> Node | None:
+    tree = None
+    for i in range(n):
+        tree = Node(i, tree, None)
+    return tree
+
+
+def sum_tree(tree: Tree) -> int:
+    total = 0
+    stack = [tree]
+    while stack:
+        match stack.pop():
+            case Tree.Node(val, left, right):
+                total += val
+                stack.append(left)
+                stack.append(right)
+    return total
+
+
+def sum_plain_tree(tree: Node | None) -> int:
+    total = 0
+    stack = [tree]
+    while stack:
+        match stack.pop():
+            case Node(val, left, right):
+                total += val
+                stack.append(left)
+                stack.append(right)
+    return total
+
+
+def test_tree_build(benchmark_peak):
+    benchmark_peak(build_tree, NODES)
+
+
+def test_tree_build_plain(benchmark_peak):
+    benchmark_peak(build_plain_tree, NODES)
+
+
+def test_tree_sum(benchmark):
+    benchmark(sum_tree, build_tree(NODES))
+
+
+def test_tree_sum_plain(benchmark):
+    benchmark(sum_plain_tree, build_plain_tree(NODES))
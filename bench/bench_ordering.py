@@ -0,0 +1,56 @@
+"""Sorting values of ordered ADTs."""
+from __future__ import annotations
+
+import random
+
+from dataclasses import dataclass
+
+from adt import ADT
+
+
+N = 100_000
+
+
+class Event(ADT, ordered=True):
+    START = "start"
+
+    @dataclass
+    class Message:
+        priority: int
+        msg: str
+
+    STOP = "stop"
+
+
+def events() -> list[Event]:
+    rng = random.Random(0)
+    members = [Event.START, Event.STOP]
+    return [
+        Event.Message(rng.randrange(100), str(i)) if i % 10 else members[i % 20 // 10]
+        for i in range(N)
+    ]
+
+
+def branching_key(event: Event) -> tuple:
+    if event is Event.START:
+        return (0,)
+    if event is Event.STOP:
+        return (2,)
+    return (1, event.priority, event.msg)
+
+
+def test_sort_comparisons(benchmark):
+    benchmark(sorted, events())
+
+
+def test_sort_branching_key(benchmark):
+    benchmark(sorted, events(), key=branching_key)
+
+
+def test_sort_key(benchmark):
+    benchmark(sorted, events(), key=Event.sort_key)
+
+
+def test_sort_keys(benchmark):
+    values = events()
+    benchmark(Event.sort_keys, values)
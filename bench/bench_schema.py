@@ -0,0 +1,61 @@
+"""Cold and warm starts of ADTs generated from schemas."""
+import shutil
+import sys
+import tempfile
+
+from adt import from_schema
+
+
+SCHEMA = {
+    "name": "Protocol",
+    "members": [{"name": f"CONST{i}", "value": i} for i in range(100)]
+    + [
+        {
+            "name": f"Message{i}",
+            "fields": [
+                {"name": "id", "type": "int"},
+                {"name": "body", "type": "str | None", "default": None},
+            ],
+        }
+        for i in range(100)
+    ],
+}
+
+
+def forget(module_name: str) -> None:
+    sys.modules.pop(module_name, None)
+
+
+def test_in_memory(benchmark):
+    module_name = from_schema(SCHEMA).__name__
+
+    benchmark.pedantic(
+        from_schema,
+        (SCHEMA,),
+        setup=lambda: forget(module_name),
+        rounds=20,
+    )
+
+
+def test_cold(benchmark, tmp_path):
+    module_name = from_schema(SCHEMA).__name__
+    dirs = []
+
+    def setup():
+        forget(module_name)
+        dirs.append(tempfile.mkdtemp(dir=tmp_path))
+        return (SCHEMA,), {"cache_dir": dirs[-1]}
+
+    benchmark.pedantic(from_schema, setup=setup, rounds=20)
+    for path in dirs:
+        shutil.rmtree(path)
+
+
+def test_warm(benchmark, tmp_path):
+    module_name = from_schema(SCHEMA, cache_dir=tmp_path).__name__
+
+    def setup():
+        forget(module_name)
+        return (SCHEMA,), {"cache_dir": tmp_path}
+
+    benchmark.pedantic(from_schema, setup=setup, rounds=20)
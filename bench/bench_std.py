@@ -0,0 +1,90 @@
+"""The built-in Option and Result against hand-rolled versions."""
+from dataclasses import dataclass
+from typing import TypeVar
+
+import pytest
+
+from adt import ADT, Option, Result
+
+
+T = TypeVar("T")
+E = TypeVar("E")
+N = 10_000
+
+
+class HandOption(ADT[T]):
+    NONE = None
+
+    @dataclass
+    class Some:
+        val: T
+
+    def map(self, fn):
+        if self is HandOption.NONE:
+            return self
+        return HandOption.Some(fn(self.val))
+
+    def unwrap_or(self, default):
+        if self is HandOption.NONE:
+            return default
+        return self.val
+
+
+class HandResult(ADT[T, E]):
+    @dataclass
+    class Ok:
+        val: T
+
+    @dataclass
+    class Err:
+        err: E
+
+
+def hand_partition(results):
+    oks = [r.val for r in results if isinstance(r, HandResult.Ok)]
+    errs = [r.err for r in results if isinstance(r, HandResult.Err)]
+    return oks, errs
+
+
+def hand_collect(results):
+    vals = []
+    for r in results:
+        if isinstance(r, HandResult.Err):
+            return r
+        vals.append(r.val)
+    return HandResult.Ok(vals)
+
+
+def inc(x):
+    return x + 1
+
+
+def map_unwrap(options):
+    for option in options:
+        option.map(inc).unwrap_or(0)
+
+
+@pytest.mark.parametrize("option", [HandOption, Option], ids=["hand", "builtin"])
+def test_map_unwrap_or(benchmark, option):
+    options = [option.Some(i) if i % 2 else option.NONE for i in range(N)]
+    benchmark(map_unwrap, options)
+
+
+def test_partition_hand(benchmark):
+    results = [HandResult.Ok(i) if i % 2 else HandResult.Err(i) for i in range(N)]
+    benchmark(hand_partition, results)
+
+
+def test_partition_builtin(benchmark):
+    results = [Result.Ok(i) if i % 2 else Result.Err(i) for i in range(N)]
+    benchmark(Result.partition, results)
+
+
+def test_collect_hand(benchmark):
+    results = [HandResult.Ok(i) for i in range(N)]
+    benchmark(hand_collect, results)
+
+
+def test_collect_builtin(benchmark):
+    results = [Result.Ok(i) for i in range(N)]
+    benchmark(Result.collect, results)
@@ -0,0 +1,46 @@
+"""Validation throughput of parametrized ADTs."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TypeVar
+
+from adt import ADT
+
+
+T = TypeVar("T")
+NODES = 100_000
+
+
+class Tree(ADT[T], validate=True):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: T
+        left: Tree[T]
+        right: Tree[T]
+
+
+def build(n: int) -> Tree[int]:
+    tree = Tree.EMPTY
+    for i in range(n):
+        tree = Tree.Node(i, tree, Tree.EMPTY)
+    return tree
+
+
+def test_construct_unchecked(benchmark):
+    node = Tree.Node
+    benchmark(node, 1, Tree.EMPTY, Tree.EMPTY)
+
+
+def test_construct_checked(benchmark):
+    node = Tree[int].Node
+    benchmark(node, 1, Tree.EMPTY, Tree.EMPTY)
+
+
+def test_validate_deep(benchmark):
+    tree = build(NODES)
+    Tree[int](tree)  # compile the checker outside of the timing
+    benchmark(Tree[int], tree)
+    if benchmark.stats is not None:  # not timed with --benchmark-disable
+        benchmark.extra_info["nodes_per_sec"] = NODES / benchmark.stats.stats.mean
@@ -0,0 +1,40 @@
+"""
+Benchmarks, run with pytest-benchmark.
+
+Benchmark modules are named `bench_*.py`, so the regular test run does
+not collect them.
+"""
+import tracemalloc
+
+import pytest
+
+
+def pytest_collect_file(file_path, parent):
+    # files given on the command line are collected by pytest itself
+    if (
+        file_path.suffix == ".py"
+        and file_path.name.startswith("bench_")
+        and not parent.session.isinitpath(file_path)
+    ):
+        return pytest.Module.from_parent(parent, path=file_path)
+
+
+@pytest.fixture
+def benchmark_peak(benchmark):
+    """
+    Like `benchmark`, also recording the tracemalloc peak of a single run.
+
+    The peak is stored as `tracemalloc_peak` in the benchmark's extra info.
+    """
+
+    def run(fn, *args, **kwargs):
+        tracemalloc.start()
+        try:
+            fn(*args, **kwargs)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["tracemalloc_peak"] = peak
+        return benchmark(fn, *args, **kwargs)
+
+    return run
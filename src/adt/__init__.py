@@ -1,7 +1,8 @@
 """Algebraic data types."""
 import sys
 
-from dataclasses import dataclass
+from copy import deepcopy
+from dataclasses import dataclass, field, fields, is_dataclass
 from enum import (
     Flag,
     _EnumDict,
@@ -9,13 +10,18 @@ from enum import (
     _make_class_unpicklable,
     _reduce_ex_by_name,
 )
+from threading import RLock
+from time import perf_counter
 from types import (
     DynamicClassAttribute,
     GenericAlias,
     MappingProxyType,
+    UnionType,
     new_class,
 )
-from typing import Any
+from typing import Any, TypeVar, Union, get_args, get_origin, get_type_hints
+
+from . import _stats
 
 
 ADT = None
@@ -27,7 +33,20 @@ class ADTMeta(type):
     """
 
     def __instancecheck__(self, __instance: Any) -> bool:
-        return type(__instance) in self._cls_set_ or isinstance(__instance, super())
+        if type(__instance) in self._cls_set_:
+            return True
+        if _stats.recorders:
+            _stats.record(self, "instancecheck_fallbacks")
+        return isinstance(__instance, super())
+
+    def _isinstance_(cls, obj) -> bool:
+        """
+        `isinstance(obj, cls)` for the library's own checks.
+
+        Unlike `isinstance`, a fallback to the class hierarchy is not recorded
+        in the statistics.
+        """
+        return type(obj) in cls._cls_set_ or isinstance(obj, super(ADTMeta, cls))
 
     @classmethod
     def __prepare__(metacls, cls, bases, **kwds):
@@ -48,9 +67,12 @@ class ADTMeta(type):
         #     )
         return enum_dict
 
-    def __new__(metacls, cls, bases, classdict, **kwds):
+    def __new__(
+        metacls, cls, bases, classdict, validate=False, ordered=False, **kwds
+    ):
         # an ADT class is final once enumeration items have been defined.
         #
+        start = perf_counter() if _stats.recorders else None
         # remove any keys listed in _ignore_
         classdict.setdefault("_ignore_", []).append("_ignore_")
         ignore = classdict["_ignore_"]
@@ -62,7 +84,6 @@ class ADTMeta(type):
             member_type,
             first_enum,
         )
-        custom_methods = metacls._gather_user_methods(classdict) if bases else {}
 
         # save enum items into separate mapping so they don't get baked into
         # the new class
@@ -70,6 +91,10 @@ class ADTMeta(type):
         for name in classdict._member_names:
             del classdict[name]
 
+        # gathered after removing the members, so class members don't get
+        # copies of each other
+        custom_methods = metacls._gather_user_methods(classdict) if bases else {}
+
         # adjust the sunders
         _order_ = classdict.pop("_order_", None)
 
@@ -90,6 +115,9 @@ class ADTMeta(type):
         enum_class._values_map_ = {}  # only for values, not classes
         enum_class._member_type_ = member_type
         enum_class._cls_set_ = set()
+        enum_class._validate_ = validate
+        enum_class._checkers_ = {}  # type args -> {variant: checked variant}
+        enum_class._sort_types_ = frozenset()  # types of the ordered values
         enum_class._unsealed = True
 
         # save DynamicClassAttribute attributes from super classes so we know
@@ -154,7 +182,15 @@ class ADTMeta(type):
         # a custom __new__ is doing something funky with the values -- such as
         # auto-numbering ;)
 
-        def customize_subclass_ns(ns: dict[str, Any]):
+        def customize_subclass_ns(ns: dict[str, Any], member_cls: type):
+            # make the subclass importable under the member's name, for pickle
+            ns["__module__"] = member_cls.__module__
+            ns["__qualname__"] = member_cls.__qualname__
+            ns["_adt_"] = enum_class
+            if not hasattr(member_cls, "__copy__"):
+                ns["__copy__"] = _copy_member
+            if not hasattr(member_cls, "__deepcopy__"):
+                ns["__deepcopy__"] = _deepcopy_member
             for k, v in custom_methods.items():
                 ns[k] = v
 
@@ -172,8 +208,14 @@ class ADTMeta(type):
             if value_is_cls:
                 # We subclass the class to add he enum_class to its MRO
                 subclass = new_class(
-                    value.__qualname__, (value,), exec_body=customize_subclass_ns
+                    value.__qualname__,
+                    (value,),
+                    exec_body=lambda ns: customize_subclass_ns(ns, value),
                 )
+                if is_dataclass(value):
+                    for f in fields(value):
+                        if f.metadata.get(_LAZY):
+                            setattr(subclass, f.name, _LazyField(f.name))
                 enum_member = subclass
                 enum_class._cls_set_.add(subclass)
             else:
@@ -193,16 +235,20 @@ class ADTMeta(type):
                 enum_member.__objclass__ = enum_class
                 enum_member.__init__(*args)
             # If another member with the same value was already defined, the
-            # new member becomes an alias to the existing one.
-            for name, canonical_member in enum_class._member_map_.items():
-                if value_is_cls:
-                    if canonical_member == enum_member:
-                        enum_member = canonical_member
-                        break
-                else:
-                    if canonical_member._value_ == enum_member._value_:
-                        enum_member = canonical_member
-                        break
+            # new member becomes an alias to the existing one. Class members
+            # are new subclasses, so they are never aliases.
+            canonical_member = None
+            if not value_is_cls:
+                try:
+                    canonical_member = enum_class._value2member_map_.get(value)
+                except TypeError:
+                    # unhashable value, search the constants linearly
+                    for member in enum_class._values_map_.values():
+                        if member._value_ == value:
+                            canonical_member = member
+                            break
+            if canonical_member is not None:
+                enum_member = canonical_member
             else:
                 # Aliases don't appear in member names (only in __members__).
                 enum_class._member_names_.append(member_name)
@@ -251,7 +297,12 @@ class ADTMeta(type):
             if _order_ != enum_class._member_names_:
                 raise TypeError("member order does not match _order_")
 
+        if ordered:
+            _install_ordering(enum_class)
+
         delattr(enum_class, "_unsealed")
+        if start is not None:
+            _stats.record(enum_class, "creation_time", perf_counter() - start)
         return enum_class
 
     def __bool__(self):
@@ -300,7 +351,7 @@ class ADTMeta(type):
         )
 
     def __contains__(cls, obj):
-        if not isinstance(obj, ADT):
+        if not ADT._isinstance_(obj):
             import warnings
 
             warnings.warn(
@@ -309,11 +360,13 @@ class ADTMeta(type):
                 DeprecationWarning,
                 stacklevel=2,
             )
+            if _stats.recorders:
+                _stats.record(cls, "contains_errors")
             raise TypeError(
                 "unsupported operand type(s) for 'in': '%s' and '%s'"
                 % (type(obj).__qualname__, cls.__class__.__qualname__)
             )
-        return isinstance(obj, cls) and obj._name_ in cls._member_map_
+        return cls._isinstance_(obj) and obj._name_ in cls._member_map_
 
     def __delattr__(cls, attr):
         # nicer error message when someone tries to delete an attribute
@@ -444,6 +497,74 @@ class ADTMeta(type):
 
         return enum_class
 
+    def _checker_(cls, args):
+        """
+        Returns the checked variants of the ADT parametrized by `args`.
+
+        The field annotations of every variant are resolved and compiled into
+        a checker function on first use; the result is cached per
+        parametrization.
+        """
+        try:
+            return cls._checkers_[args]
+        except KeyError:
+            pass
+        with _checker_lock:
+            # another thread may have compiled it in the meantime
+            try:
+                return cls._checkers_[args]
+            except KeyError:
+                pass
+            # recursive variants referring back to a parametrization being
+            # compiled find its (still incomplete) table here
+            try:
+                return _pending_checkers[cls, args]
+            except KeyError:
+                pass
+            outermost = not _pending_checkers
+            checkers = _pending_checkers[cls, args] = {}
+            try:
+                subst = dict(zip(_type_params(cls), args))
+                for variant in cls._cls_set_:
+                    checkers[variant] = _CheckedVariant(
+                        variant, _compile_checker(cls, variant, subst)
+                    )
+            except BaseException:
+                # tables of nested ADTs compiled in the meantime may refer to
+                # this one, so they are discarded as well
+                _pending_checkers.clear()
+                raise
+            if outermost:
+                # the tables are only visible to other threads once they are
+                # all complete
+                for (adt, pending_args), table in _pending_checkers.items():
+                    adt._checkers_[pending_args] = table
+                _pending_checkers.clear()
+        return checkers
+
+    def sort_key(cls, value):
+        """
+        Returns the sort key of a value of an ordered ADT.
+
+        Keys are tuples of the member's definition order followed by its
+        fields, with nested ordered ADT values replaced by their keys, so
+        comparing them needs no dispatch to ADT methods. Raises `TypeError`
+        if `cls` is not ordered or `value` is not one of its values.
+        """
+        if type(value) not in cls._sort_types_:
+            raise _sort_key_error(cls, value)
+        return type(value)._sort_key_fn_(value)
+
+    def sort_keys(cls, values):
+        """Returns the sort keys of many values of an ordered ADT."""
+        types = cls._sort_types_
+        res = []
+        for value in values:
+            if type(value) not in types:
+                raise _sort_key_error(cls, value)
+            res.append(type(value)._sort_key_fn_(value))
+        return res
+
     def _convert_(cls, name, module, filter, source=None):
         """
         Create a new Enum subclass that replaces a collection of global constants
@@ -620,10 +741,14 @@ class ADT(metaclass=ADTMeta):
             pass
         except TypeError:
             # not there, now do long search -- O(n) behavior
+            if _stats.recorders:
+                _stats.record(cls, "linear_scans")
             for member in cls._values_map_.values():
                 if member._value_ == value:
                     return member
         # still not found -- try _missing_ hook
+        if _stats.recorders:
+            _stats.record(cls, "missing_calls")
         try:
             exc = None
             result = cls._missing_(value)
@@ -631,7 +756,7 @@ class ADT(metaclass=ADTMeta):
             exc = e
             result = None
         try:
-            if isinstance(result, cls):
+            if cls._isinstance_(result):
                 return result
             else:
                 ve_exc = ValueError("%r is not a valid %s" % (value, cls.__qualname__))
@@ -714,6 +839,12 @@ class ADT(metaclass=ADTMeta):
     def __reduce_ex__(self, proto):
         return self.__class__, (self._value_,)
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __instancecheck__(self, __instance: Any) -> bool:
         return type(__instance) in self._cls_set_ or isinstance(__instance, super())
 
@@ -735,4 +866,599 @@ class ADT(metaclass=ADTMeta):
         return self._value_
 
     def __class_getitem__(cls, types):
+        if cls._validate_:
+            return _ValidatingAlias(cls, types)
         return GenericAlias(cls, types)
+
+
+_LAZY = "adt.lazy"
+
+
+def lazy(**kwargs):
+    """
+    Declare a lazy field on a dataclass class member.
+
+    A lazy field may be given a `Thunk`, which is evaluated on first access
+    and replaced by its result. Takes the same arguments as
+    `dataclasses.field`.
+    """
+    metadata = dict(kwargs.pop("metadata", None) or {})
+    metadata[_LAZY] = True
+    return field(metadata=metadata, **kwargs)
+
+
+class Thunk:
+    """A deferred computation of a lazy field value."""
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn):
+        self.fn = fn
+
+    def __repr__(self):
+        return "<Thunk %r>" % (self.fn,)
+
+
+class _LazyField:
+    """Evaluates a `Thunk` stored in a lazy field on first access."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        ns = obj.__dict__
+        try:
+            value = ns[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if type(value) is Thunk:
+            value = ns[self.name] = value.fn()
+        return value
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+
+# (ADT, type args) -> checker table of the compilation in progress; only
+# used with _checker_lock held
+_pending_checkers = {}
+_checker_lock = RLock()
+
+
+class _ValidatingAlias(GenericAlias):
+    """
+    A parametrized ADT created with `validate=True`.
+
+    Class members fetched through the alias check their fields on
+    construction, and calling the alias validates a value deeply.
+    """
+
+    def __getattribute__(self, name):
+        if name[0] != "_":
+            origin = GenericAlias.__getattribute__(self, "__origin__")
+            member = origin._member_map_.get(name)
+            if isinstance(member, type):
+                args = GenericAlias.__getattribute__(self, "__args__")
+                return origin._checker_(args)[member]
+        return super().__getattribute__(name)
+
+    def __call__(self, value):
+        origin = self.__origin__
+        member = origin(value)
+        _check_deep(member, origin._checker_(self.__args__))
+        return member
+
+
+class _CheckedVariant:
+    """A class member constructor that checks the fields it is given."""
+
+    __slots__ = ("variant", "check")
+
+    def __init__(self, variant, check):
+        self.variant = variant
+        self.check = check
+
+    def __call__(self, *args, **kwargs):
+        obj = self.variant(*args, **kwargs)
+        self.check(obj, None)
+        return obj
+
+    def __instancecheck__(self, instance):
+        return isinstance(instance, self.variant)
+
+    def __getattr__(self, name):
+        return getattr(self.variant, name)
+
+    def __repr__(self):
+        return "<checked %s>" % self.variant.__qualname__
+
+
+def _type_params(cls):
+    """The type variables an ADT was declared generic over."""
+    return tuple(
+        param
+        for base in cls.__dict__.get("__orig_bases__", ())
+        for param in getattr(base, "__parameters__", ())
+    )
+
+
+def _subst(tp, mapping):
+    """Replace type variables in `tp`; unbound ones become `Any`."""
+    if isinstance(tp, TypeVar):
+        return mapping.get(tp, Any)
+    args = get_args(tp)
+    if not args:
+        return tp
+    args = tuple(_subst(arg, mapping) for arg in args)
+    origin = get_origin(tp)
+    if isinstance(origin, ADTMeta):
+        return origin[args]
+    if isinstance(tp, GenericAlias):
+        return GenericAlias(origin, args)
+    if origin is Union or origin is UnionType:
+        return Union[args]
+    return tp
+
+
+# the types PEP 484 accepts in place of a numeric type
+_NUMERIC_PROMOTIONS = {float: (float, int), complex: (complex, float, int)}
+
+
+def _runtime_type(tp):
+    """
+    The class (or tuple of classes) `isinstance` can check `tp` with.
+
+    Returns None for types that cannot be checked at runtime. Following PEP
+    484, `int` is accepted for `float`, and `int` and `float` for `complex`.
+    """
+    if tp is Any or tp is object:
+        return None
+    origin = get_origin(tp)
+    if origin is None:
+        if tp in _NUMERIC_PROMOTIONS:
+            return _NUMERIC_PROMOTIONS[tp]
+        return tp if isinstance(tp, type) else None
+    if origin is Union or origin is UnionType:
+        res = []
+        for arg in get_args(tp):
+            arg_type = _runtime_type(arg)
+            if arg_type is None:
+                return None
+            res.extend(arg_type if isinstance(arg_type, tuple) else (arg_type,))
+        return tuple(res)
+    if isinstance(origin, type):
+        return origin
+    return None
+
+
+def _type_repr(tp):
+    if get_origin(tp) is None and isinstance(tp, type):
+        return tp.__qualname__
+    return repr(tp)
+
+
+def _field_error(obj, name, tp, value):
+    raise TypeError(
+        "%s.%s must be %s, not %r"
+        % (type(obj).__qualname__, name, _type_repr(tp), value)
+    )
+
+
+def _compile_checker(adt, variant, subst):
+    """
+    Compile a function checking the fields of a `variant` instance.
+
+    The function takes the instance and a `push` callable. Fields holding
+    parametrized ADTs are passed to `push` along with their checked
+    variants so they can be validated deeply; `push` may be None.
+    """
+    hints = get_type_hints(variant, localns={adt.__name__: adt})
+    if is_dataclass(variant):
+        names = [f.name for f in fields(variant)]
+    else:
+        names = list(hints)
+    ns = {"_error": _field_error, "_Thunk": Thunk}
+    lines = []
+    for ix, name in enumerate(names):
+        tp = _subst(hints.get(name, Any), subst)
+        if isinstance(get_origin(tp), ADTMeta):
+            member_adt, args = get_origin(tp), get_args(tp)
+        elif isinstance(tp, ADTMeta):
+            member_adt, args = tp, ()
+        else:
+            member_adt = None
+        ns[f"_hint{ix}"] = tp
+        if member_adt is not None:
+            # members are checked by exact type, avoiding __instancecheck__
+            ns[f"_types{ix}"] = frozenset(member_adt._cls_set_) | {member_adt}
+            ns[f"_checkers{ix}"] = member_adt._checker_(args)
+            ns[f"_adt{ix}"] = member_adt
+            field_lines = [
+                f"if type(v) not in _types{ix}:",
+                f"    _error(obj, {name!r}, _hint{ix}, v)",
+                # constants need no further checks
+                f"if push is not None and type(v) is not _adt{ix}:",
+                f"    push((v, _checkers{ix}))",
+            ]
+        else:
+            runtime_type = _runtime_type(tp)
+            if runtime_type is None:
+                continue
+            ns[f"_type{ix}"] = runtime_type
+            field_lines = [
+                f"if not isinstance(v, _type{ix}):",
+                f"    _error(obj, {name!r}, _hint{ix}, v)",
+            ]
+        if isinstance(variant.__dict__.get(name), _LazyField):
+            # unevaluated lazy fields are left alone
+            lines.append(f"    v = obj.__dict__[{name!r}]")
+            lines.append("    if type(v) is not _Thunk:")
+            lines.extend("        " + line for line in field_lines)
+        else:
+            lines.append(f"    v = obj.{name}")
+            lines.extend("    " + line for line in field_lines)
+    lines = lines or ["    pass"]
+    exec("def check(obj, push):\n" + "\n".join(lines), ns)
+    return ns["check"]
+
+
+def _install_ordering(cls):
+    """
+    Order the values of `cls` by definition order, then by fields.
+
+    Every type of an ordered value gets a `_sort_key_fn_`, returning the sort
+    key of a value, and a `_sort_fields_`, returning its key with nested
+    ordered values left in place.
+    """
+    types = cls._sort_types_ = frozenset(cls._cls_set_) | {cls}
+    for ordinal, name in enumerate(cls._member_names_):
+        member = cls._member_map_[name]
+        if isinstance(member, type):
+            member._sort_fields_, member._sort_key_fn_ = _compile_sort_key(
+                member, ordinal
+            )
+        else:
+            member._sort_key_ = (ordinal,)
+    cls._sort_fields_ = cls._sort_key_fn_ = _constant_sort_key
+
+    def __lt__(self, other):
+        if type(other) not in types:
+            return NotImplemented
+        return type(self)._sort_key_fn_(self) < type(other)._sort_key_fn_(other)
+
+    def __le__(self, other):
+        if type(other) not in types:
+            return NotImplemented
+        return type(self)._sort_key_fn_(self) <= type(other)._sort_key_fn_(other)
+
+    def __gt__(self, other):
+        if type(other) not in types:
+            return NotImplemented
+        return type(self)._sort_key_fn_(self) > type(other)._sort_key_fn_(other)
+
+    def __ge__(self, other):
+        if type(other) not in types:
+            return NotImplemented
+        return type(self)._sort_key_fn_(self) >= type(other)._sort_key_fn_(other)
+
+    for target in types:
+        for method in (__lt__, __le__, __gt__, __ge__):
+            setattr(target, method.__name__, method)
+
+
+def _sort_key_error(cls, value):
+    if not cls._sort_types_:
+        return TypeError("%s is not ordered" % (cls.__name__,))
+    return TypeError("%r is not a value of %s" % (value, cls.__name__))
+
+
+def _constant_sort_key(value):
+    return value._sort_key_
+
+
+def _is_ordered(obj) -> bool:
+    cls = type(obj)
+    return cls not in _ATOMIC and getattr(cls, "_sort_fields_", None) is not None
+
+
+def _compile_sort_key(variant, ordinal):
+    """
+    Compile the `_sort_fields_` and `_sort_key_fn_` functions of a class
+    member.
+
+    Fields excluded from comparisons (`field(compare=False)`) are skipped.
+    Values without nested ordered values get their key directly; the others
+    go through `_nested_sort_key`.
+    """
+    if is_dataclass(variant):
+        names = [f.name for f in fields(variant) if f.compare]
+    else:
+        names = list(getattr(variant, "__match_args__", ()))
+    items = [str(ordinal)] + [f"v.{name}" for name in names]
+    lines = ["def sort_fields(v):", f"    return ({', '.join(items)},)"]
+    lines.append("def sort_key(v):")
+    for ix, name in enumerate(names):
+        lines.append(f"    f{ix} = v.{name}")
+        lines.append(f"    t{ix} = type(f{ix})")
+        lines.append(
+            f"    if t{ix} not in _atomic and _get(t{ix}, '_sort_fields_', None):"
+        )
+        lines.append("        return _nested(v)")
+    items = [str(ordinal)] + [f"f{ix}" for ix in range(len(names))]
+    lines.append(f"    return ({', '.join(items)},)")
+    ns = {"_atomic": _ATOMIC, "_get": getattr, "_nested": _nested_sort_key}
+    exec("\n".join(lines), ns)
+    return ns["sort_fields"], ns["sort_key"]
+
+
+def _nested_sort_key(value):
+    """The sort key of an ordered value with nested ordered values, iteratively."""
+    keys = {}
+    active = set()
+    stack = [(value, None)]
+    while stack:
+        node, items = stack.pop()
+        if items is not None:
+            keys[id(node)] = tuple(
+                keys[id(item)] if _is_ordered(item) else item for item in items
+            )
+            active.discard(id(node))
+            continue
+        if id(node) in keys:
+            continue
+        if id(node) in active:
+            raise ValueError("cannot order a cyclic value")
+        active.add(id(node))
+        items = type(node)._sort_fields_(node)
+        stack.append((node, items))
+        stack.extend(
+            (item, None) for item in items if _is_ordered(item) and id(item) not in keys
+        )
+    return keys[id(value)]
+
+
+_field_names = {}  # class member -> names of its dataclass fields
+
+
+def _field_values(obj):
+    """
+    Returns the (name, value) pairs of the fields of a class member instance.
+
+    Unevaluated lazy fields are returned as their `Thunk`.
+    """
+    cls = type(obj)
+    try:
+        names = _field_names[cls]
+    except KeyError:
+        names = _field_names[cls] = (
+            tuple(f.name for f in fields(cls)) if is_dataclass(cls) else None
+        )
+    ns = getattr(obj, "__dict__", None)
+    if names is None:
+        return list(ns.items()) if ns is not None else []
+    res = []
+    for name in names:
+        if ns is not None and name in ns:
+            res.append((name, ns[name]))
+        else:
+            res.append((name, getattr(obj, name)))
+    return res
+
+
+_copy_info = {}  # class member -> (names of its slots, whether it's frozen)
+
+
+def _state(obj):
+    """
+    Returns the (name, value) pairs of the attributes of a class member
+    instance, in its `__dict__` and slots.
+
+    Unevaluated lazy fields are returned as their `Thunk`.
+    """
+    cls = type(obj)
+    try:
+        slots = _copy_info[cls][0]
+    except KeyError:
+        slots = _class_copy_info(cls)[0]
+    ns = getattr(obj, "__dict__", None)
+    res = list(ns.items()) if ns is not None else []
+    for name in slots:
+        try:
+            res.append((name, getattr(obj, name)))
+        except AttributeError:
+            pass
+    return res
+
+
+def _class_copy_info(cls):
+    slots = []
+    for base in cls.__mro__:
+        names = base.__dict__.get("__slots__", ())
+        if isinstance(names, str):
+            names = (names,)
+        slots.extend(n for n in names if n not in ("__dict__", "__weakref__"))
+    params = getattr(cls, "__dataclass_params__", None)
+    info = _copy_info[cls] = (tuple(slots), params is not None and params.frozen)
+    return info
+
+
+def _set_state(obj, state):
+    slots = _copy_info[type(obj)][0]
+    ns = getattr(obj, "__dict__", None)
+    for name, value in state:
+        if name in slots:
+            object.__setattr__(obj, name, value)
+        else:
+            ns[name] = value
+
+
+# types deep copied as themselves
+_ATOMIC = frozenset(
+    {type(None), bool, int, float, complex, str, bytes, type, range, Thunk}
+)
+
+
+# collections whose class member instances are copied without recursion,
+# along with dicts
+_COLLECTIONS = frozenset({list, tuple, set, frozenset})
+
+
+def _is_member_instance(obj):
+    # checked for constants first, whose attribute lookups are slow
+    cls = type(obj)
+    return not isinstance(cls, ADTMeta) and getattr(cls, "_adt_", None) is not None
+
+
+def _copy_member(self):
+    """`__copy__` of class members."""
+    state = _state(self)
+    new = object.__new__(type(self))
+    _set_state(new, state)
+    return new
+
+
+def _deepcopy_member(self, memo):
+    """
+    `__deepcopy__` of class members.
+
+    Class member instances held by fields, directly or in lists, tuples,
+    sets and dicts, are copied without recursion, and copied once if
+    reachable through several paths. Instances nested deeper in other
+    objects are copied by `deepcopy`, recursively. Frozen class members
+    whose fields are all unchanged by copying are not copied. Unevaluated
+    lazy fields keep their `Thunk`.
+    """
+    keep_alive = memo.setdefault(id(memo), [])
+    active = {}  # id -> state, of the instances being copied
+    stack = [self]
+    while stack:
+        obj = stack[-1]
+        key = id(obj)
+        state = active.pop(key, None)
+        if state is None:
+            if key in memo:
+                stack.pop()
+                continue
+            state = active[key] = _state(obj)
+            cls = type(obj)
+            if not _copy_info[cls][1]:
+                # allocated upfront, so cycles can refer to the copy
+                memo[key] = object.__new__(cls)
+                keep_alive.append(obj)
+            for child in _state_members(state):
+                child_key = id(child)
+                if child_key in memo:
+                    continue
+                if child_key in active:
+                    # a cycle through a frozen class member, which needs a
+                    # copy to refer to after all
+                    memo[child_key] = object.__new__(type(child))
+                    keep_alive.append(child)
+                    continue
+                stack.append(child)
+            continue
+        stack.pop()
+        copied = [(name, _copy_field(value, memo)) for name, value in state]
+        new = memo.get(key)
+        if new is None:
+            if all(c[1] is s[1] for c, s in zip(copied, state)):
+                memo[key] = obj
+                continue
+            new = memo[key] = object.__new__(type(obj))
+            keep_alive.append(obj)
+        _set_state(new, copied)
+    return memo[id(self)]
+
+
+def _state_members(state):
+    """The class member instances held by the fields of `state`."""
+    for _, value in state:
+        cls = type(value)
+        if cls in _ATOMIC or isinstance(cls, ADTMeta):
+            continue
+        if cls in _COLLECTIONS:
+            yield from (item for item in value if _is_member_instance(item))
+        elif cls is dict:
+            for key, item in value.items():
+                if _is_member_instance(key):
+                    yield key
+                if _is_member_instance(item):
+                    yield item
+        elif getattr(cls, "_adt_", None) is not None:
+            yield value
+
+
+def _copy_field(value, memo):
+    """Deep copy a field value, whose class member instances are copied."""
+    cls = type(value)
+    if cls in _ATOMIC or isinstance(cls, ADTMeta):
+        return value
+    if getattr(cls, "_adt_", None) is not None:
+        return memo[id(value)]
+    if cls not in _COLLECTIONS and cls is not dict:
+        return deepcopy(value, memo)
+    try:
+        return memo[id(value)]
+    except KeyError:
+        pass
+    if cls is tuple or cls is frozenset:
+        items = [_copy_item(item, memo) for item in value]
+        if all(c is v for c, v in zip(items, value)):
+            return value
+        copied = memo[id(value)] = cls(items)
+        memo[id(memo)].append(value)
+        return copied
+    # mutable collections are registered before their items are copied, in
+    # case the items refer back to them
+    copied = memo[id(value)] = cls()
+    memo[id(memo)].append(value)
+    if cls is list:
+        copied.extend(_copy_item(item, memo) for item in value)
+    elif cls is set:
+        copied.update(_copy_item(item, memo) for item in value)
+    else:
+        for key, item in value.items():
+            copied[_copy_item(key, memo)] = _copy_item(item, memo)
+    return copied
+
+
+def _copy_item(item, memo):
+    if _is_member_instance(item):
+        return memo[id(item)]
+    return deepcopy(item, memo)
+
+
+def _check_deep(value, checkers):
+    """Validate `value` and everything reachable from it, iteratively."""
+    stack = [(value, checkers)]
+    push = stack.append
+    seen = set()
+    while stack:
+        value, checkers = stack.pop()
+        checked = checkers.get(type(value))
+        if checked is None:
+            # a constant
+            continue
+        key = (id(value), id(checkers))
+        if key in seen:
+            continue
+        seen.add(key)
+        checked.check(value, push)
+
+
+from ._fold import fold, parallel_fold  # noqa: E402
+from ._schema import from_schema  # noqa: E402
+from ._sizeof import SizeReport, sizeof  # noqa: E402
+from ._stats import (  # noqa: E402
+    ADTStats,
+    StatsRecorder,
+    collect_stats,
+    disable_stats,
+    enable_stats,
+    stats_snapshot,
+)
+from ._std import Option, Result  # noqa: E402
@@ -0,0 +1,213 @@
+"""Folding recursive ADT values, sequentially or in parallel."""
+from __future__ import annotations
+
+import os
+
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, Callable, TypeVar
+
+from . import ADTMeta, Thunk, _field_values
+
+
+R = TypeVar("R")
+
+# The maximum height of the subtrees sent to worker processes. Pickle
+# recurses through values, so deeper subtrees could exceed the recursion
+# limit; they are folded in the calling process instead.
+_MAX_SHIPPED_HEIGHT = 64
+
+
+def fold(value: Any, fn: Callable[[Any], R], combine: Callable[[R, R], R]) -> R:
+    """
+    Reduce an ADT value and all the ADT values nested within it.
+
+    Every ADT value (class member instance or constant) is mapped with `fn`,
+    and the results are combined with `combine` in pre-order: a value
+    before the values in its fields, in field order. ADT values in fields
+    directly or in lists and tuples in fields are included.
+
+    `combine` must be associative. The result of a value reachable through
+    several paths, like a shared subtree, is computed once and reused.
+    The value is walked without recursion, and lazy fields are evaluated.
+    """
+    return _fold(value, fn, combine, {})
+
+
+def parallel_fold(
+    value: Any,
+    fn: Callable[[Any], R],
+    combine: Callable[[R, R], R],
+    *,
+    threshold: int | None = None,
+    max_workers: int | None = None,
+    threads: bool = False,
+) -> R:
+    """
+    Like `fold`, but folds large subtrees in a pool of worker processes.
+
+    The value is split at subtrees of at most `threshold` values, which are
+    sent to the workers in batches of about `threshold` values; the rest is
+    folded in this process, combining the results of the workers. By
+    default, `threshold` splits the value into about four batches per
+    worker. With a single worker, this is just `fold`.
+
+    Process workers receive the subtrees pickled, so the ADT, `fn` and
+    `combine` must be picklable. As pickle recurses through values, only
+    subtrees at most 64 levels high are sent to processes; deeper parts of
+    the value, like long chains, are folded in this process. With
+    `threads=True`, a thread pool is used instead, which only helps if `fn`
+    releases the GIL.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1:
+        return fold(value, fn, combine)
+    sizes, heights = _measure(value)
+    total = sizes[id(value)]
+    if threshold is None:
+        threshold = max(1, total // (workers * 4))
+    if total <= threshold:
+        return fold(value, fn, combine)
+    max_height = None if threads else _MAX_SHIPPED_HEIGHT
+
+    # find the subtrees to send to the workers, and the values above them in
+    # post-order
+    upper = []
+    shipped = []
+    seen = set()
+    stack = [(value, None)]
+    while stack:
+        node, children = stack.pop()
+        if children is not None:
+            upper.append((node, children))
+            continue
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if sizes[id(node)] <= threshold and (
+            max_height is None or heights[id(node)] <= max_height
+        ):
+            shipped.append(node)
+            continue
+        children = _children(node)
+        stack.append((node, children))
+        stack.extend((child, None) for child in reversed(children))
+
+    batches = []
+    batch = []
+    batch_size = 0
+    for node in shipped:
+        batch.append(node)
+        batch_size += sizes[id(node)]
+        if batch_size >= threshold:
+            batches.append(batch)
+            batch = []
+            batch_size = 0
+    if batch:
+        batches.append(batch)
+
+    results = {}
+    if batches:
+        pool: Executor
+        if threads:
+            pool = ThreadPoolExecutor(workers)
+        else:
+            pool = ProcessPoolExecutor(workers)
+        with pool:
+            futures = [
+                pool.submit(_fold_batch, batch, fn, combine) for batch in batches
+            ]
+            for batch, future in zip(batches, futures):
+                for node, result in zip(batch, future.result()):
+                    results[id(node)] = result
+
+    for node, children in upper:
+        acc = fn(node)
+        for child in children:
+            acc = combine(acc, results[id(child)])
+        results[id(node)] = acc
+    return results[id(value)]
+
+
+def _is_adt_value(obj) -> bool:
+    cls = type(obj)
+    return isinstance(cls, ADTMeta) or getattr(cls, "_adt_", None) is not None
+
+
+def _children(node) -> list:
+    """The ADT values in the fields of `node`, evaluating lazy fields."""
+    if isinstance(type(node), ADTMeta):
+        # constants have no fields
+        return []
+    res = []
+    for name, field_value in _field_values(node):
+        if type(field_value) is Thunk:
+            field_value = getattr(node, name)
+        if type(field_value) is list or type(field_value) is tuple:
+            res.extend(item for item in field_value if _is_adt_value(item))
+        elif _is_adt_value(field_value):
+            res.append(field_value)
+    return res
+
+
+def _fold(value, fn, combine, results: dict[int, Any]):
+    stack = [(value, None)]
+    active = set()
+    while stack:
+        node, children = stack.pop()
+        if children is not None:
+            acc = fn(node)
+            for child in children:
+                acc = combine(acc, results[id(child)])
+            results[id(node)] = acc
+            active.discard(id(node))
+            continue
+        if id(node) in results:
+            continue
+        if id(node) in active:
+            raise ValueError("cannot fold a cyclic value")
+        active.add(id(node))
+        children = _children(node)
+        stack.append((node, children))
+        stack.extend(
+            (child, None) for child in reversed(children) if id(child) not in results
+        )
+    return results[id(value)]
+
+
+def _fold_batch(nodes: list, fn, combine) -> list:
+    results: dict[int, Any] = {}
+    return [_fold(node, fn, combine, results) for node in nodes]
+
+
+def _measure(value) -> tuple[dict[int, int], dict[int, int]]:
+    """The number of values in, and the height of, each subtree, by id."""
+    sizes: dict[int, int] = {}
+    heights: dict[int, int] = {}
+    stack = [(value, None)]
+    active = set()
+    while stack:
+        node, children = stack.pop()
+        if children is not None:
+            size = 1
+            height = 0
+            for child in children:
+                size += sizes[id(child)]
+                if heights[id(child)] > height:
+                    height = heights[id(child)]
+            sizes[id(node)] = size
+            heights[id(node)] = height + 1
+            active.discard(id(node))
+            continue
+        if id(node) in sizes:
+            continue
+        if id(node) in active:
+            raise ValueError("cannot fold a cyclic value")
+        active.add(id(node))
+        children = _children(node)
+        stack.append((node, children))
+        stack.extend((child, None) for child in children if id(child) not in sizes)
+    return sizes, heights
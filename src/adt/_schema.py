@@ -0,0 +1,275 @@
+"""Generating ADTs from declarative schemas."""
+from __future__ import annotations
+
+import ast
+import json
+import os
+import sys
+import tempfile
+
+from hashlib import sha256
+from importlib.util import module_from_spec, spec_from_file_location
+from keyword import iskeyword
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Mapping, Sequence, Union
+
+
+# Bump whenever the generated source changes, invalidating cached modules.
+_GENERATOR_VERSION = 1
+
+_OPTIONS = frozenset({"validate", "ordered"})
+
+_JSON_SCALARS = frozenset({str, int, float, bool})
+
+# The nodes allowed in field type expressions.
+_TYPE_NODES = (
+    ast.Expression,
+    ast.Name,
+    ast.Attribute,
+    ast.Subscript,
+    ast.Tuple,
+    ast.List,
+    ast.Constant,
+    ast.BinOp,
+    ast.BitOr,
+    ast.Load,
+)
+
+Schema = Mapping[str, Any]
+
+
+def from_schema(
+    schema: Union[Schema, Sequence[Schema]], *, cache_dir: Union[str, Path, None] = None
+) -> ModuleType:
+    """
+    Generate a module of ADTs from a schema.
+
+    A schema describes one ADT, or is a list of ADT schemas:
+
+    ```python
+    {
+        "name": "Event",
+        "params": ["T"],  # Optional type variables.
+        "options": {"ordered": True},  # Optional, `validate` or `ordered`.
+        "members": [
+            {"name": "QUIT", "value": "quit"},
+            {"name": "Message", "fields": [
+                {"name": "msg", "type": "str"},
+                {"name": "payload", "type": "T | None", "default": None},
+            ]},
+        ],
+    }
+    ```
+
+    Schemas must be JSON-compatible: made of dicts with string keys,
+    lists, strings, numbers, booleans and None. Constant values and field defaults
+    must be literals, and field types are Python type expressions, which
+    are not evaluated during generation. Class members are generated with
+    the `__init__`, `__repr__` and `__eq__` methods `dataclass` would
+    generate written out, rather than as dataclasses.
+
+    The module is named after a hash of the schema and registered in
+    `sys.modules`, so the ADTs can be pickled. If `cache_dir` is given, the
+    generated source is saved there and imported, and Python caches its
+    bytecode; later calls with the same schema, in this process or another,
+    skip generation and compilation entirely.
+    """
+    schemas = [schema] if isinstance(schema, Mapping) else list(schema)
+    # values JSON cannot tell apart, like tuples and lists, would share a
+    # module
+    _check_json(schemas)
+    digest = sha256(
+        json.dumps([_GENERATOR_VERSION, schemas], sort_keys=True).encode()
+    ).hexdigest()
+    module_name = f"adt_schema_{digest[:16]}"
+    try:
+        return sys.modules[module_name]
+    except KeyError:
+        pass
+
+    if cache_dir is None:
+        module = ModuleType(module_name)
+        sys.modules[module_name] = module
+        try:
+            code = compile(_generate(schemas), f"<{module_name}>", "exec")
+            exec(code, module.__dict__)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+        return module
+
+    path = Path(cache_dir) / f"{module_name}.py"
+    if not path.exists():
+        source = _generate(schemas)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write atomically, so concurrent processes never see partial files
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(source)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    spec = spec_from_file_location(module_name, path)
+    module = module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def _generate(schemas: list[Schema]) -> str:
+    """Returns the source of a module defining the ADTs of `schemas`."""
+    lines = [
+        "# Generated by adt from a schema, do not edit.",
+        "from __future__ import annotations",
+        "",
+        "from typing import *",
+        "",
+        "from adt import ADT",
+    ]
+    params = {p for schema in schemas for p in schema.get("params", ())}
+    if params:
+        lines.append("")
+    for param in sorted(params):
+        _check_name(param)
+        lines.append(f"{param} = TypeVar({param!r})")
+    for schema in schemas:
+        lines.extend(["", ""])
+        lines.extend(_generate_adt(schema))
+    return "\n".join(lines) + "\n"
+
+
+def _generate_adt(schema: Schema) -> list[str]:
+    name = schema["name"]
+    _check_name(name)
+    bases = "ADT"
+    if schema.get("params"):
+        bases += "[" + ", ".join(schema["params"]) + "]"
+    for option, value in schema.get("options", {}).items():
+        if option not in _OPTIONS or not isinstance(value, bool):
+            raise ValueError(f"{name}: invalid option {option}={value!r}")
+        bases += f", {option}={value!r}"
+    lines = [f"class {name}({bases}):"]
+    for member in schema["members"]:
+        member_name = member["name"]
+        _check_name(member_name)
+        if "fields" not in member:
+            lines.append(f"    {member_name} = {_literal(member['value'])}")
+            continue
+        if len(lines) > 1:
+            lines.append("")
+        lines.extend(_generate_member(member_name, member["fields"]))
+    if not schema["members"]:
+        lines.append("    pass")
+    return lines
+
+
+def _generate_member(name: str, fields: list[Schema]) -> list[str]:
+    """
+    Returns the source of a class member with the given fields.
+
+    The methods `dataclass` would generate are written out, so importing
+    the module does not generate any more code.
+    """
+    names = []
+    params = ["self"]
+    defaults = False
+    for field in fields:
+        field_name = field["name"]
+        _check_name(field_name)
+        if field_name == "self":
+            raise ValueError(f"{name}: invalid field name 'self'")
+        names.append(field_name)
+        param = f"{field_name}: {_type(field['type'])}"
+        if "default" in field:
+            if isinstance(field["default"], (list, dict, set)):
+                raise ValueError(f"{name}.{field_name}: mutable default")
+            param += f" = {_literal(field['default'])}"
+            defaults = True
+        elif defaults:
+            raise ValueError(f"{name}.{field_name}: field without default")
+        params.append(param)
+    lines = [f"    class {name}:"]
+    lines.append(f"        __match_args__ = {tuple(names)!r}")
+    lines.extend(f"        {param}" for param in params[1:])
+    lines.append("")
+    lines.append(f"        def __init__({', '.join(params)}):")
+    lines.extend(f"            self.{n} = {n}" for n in names)
+    if not names:
+        lines.append("            pass")
+    reprs = ", ".join(f"{n}={{self.{n}!r}}" for n in names)
+    fields_tuple = _tuple(f"self.{n}" for n in names)
+    other_tuple = _tuple(f"other.{n}" for n in names)
+    lines.extend(
+        [
+            "",
+            "        def __repr__(self):",
+            f'            return f"{{self.__class__.__qualname__}}({reprs})"',
+            "",
+            "        def __eq__(self, other):",
+            "            if other.__class__ is self.__class__:",
+            f"                return {fields_tuple} == {other_tuple}",
+            "            return NotImplemented",
+            "",
+            "        __hash__ = None",
+        ]
+    )
+    return lines
+
+
+def _tuple(items) -> str:
+    items = list(items)
+    if len(items) == 1:
+        return f"({items[0]},)"
+    return f"({', '.join(items)})"
+
+
+def _check_json(value: Any) -> None:
+    """Raise `TypeError` if `value` contains anything JSON cannot represent."""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if type(value) is list:
+            stack.extend(value)
+        elif isinstance(value, Mapping):
+            for key in value:
+                if type(key) is not str:
+                    raise TypeError(f"{key!r} is not a JSON object key")
+            stack.extend(value.values())
+        elif value is not None and type(value) not in _JSON_SCALARS:
+            raise TypeError(f"{value!r} is not JSON-compatible")
+
+
+def _check_name(name: str) -> None:
+    if not isinstance(name, str) or not name.isidentifier() or iskeyword(name):
+        raise ValueError(f"{name!r} is not a valid name")
+
+
+def _literal(value: Any) -> str:
+    source = repr(value)
+    try:
+        valid = ast.literal_eval(source) == value
+    except (ValueError, SyntaxError):
+        valid = False
+    if not valid:
+        raise ValueError(f"{value!r} is not a literal")
+    return source
+
+
+def _type(expr: str) -> str:
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError:
+        raise ValueError(f"{expr!r} is not a type expression") from None
+    for node in ast.walk(tree):
+        if not isinstance(node, _TYPE_NODES) or (
+            isinstance(node, ast.BinOp) and not isinstance(node.op, ast.BitOr)
+        ):
+            raise ValueError(f"{expr!r} is not a type expression")
+    return expr
@@ -0,0 +1,146 @@
+"""Deep memory accounting of ADT values."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from random import Random
+from sys import getsizeof
+from typing import Any
+
+from . import ADTMeta, _field_values
+
+
+_CONTAINERS = (list, tuple, set, frozenset)
+
+
+@dataclass(frozen=True)
+class SizeReport:
+    """The memory used by an ADT value, in bytes."""
+
+    #: The total size.
+    total: int
+    #: The size of the class member instances themselves, per class member.
+    variants: dict[type, int]
+    #: The size of the data held by fields, per (class member, field name).
+    #: Nested ADT values are accounted for under their own class members.
+    fields: dict[tuple[type, str], int]
+    #: The number of class member instances.
+    nodes: int
+    #: Whether the report is an estimate from sampling.
+    estimated: bool = False
+
+
+def sizeof(value: Any, *, samples: int | None = None, seed: Any = None) -> SizeReport:
+    """
+    Returns the memory used by an ADT value and everything it holds.
+
+    The value is walked without recursion, and objects reachable through
+    several paths (like shared subtrees) are counted once. Constant members
+    belong to their ADT and are not counted. Builtin containers are walked;
+    other objects are measured with `sys.getsizeof`. Unevaluated lazy fields
+    are not evaluated.
+
+    If `samples` is given, the size is instead estimated from that many
+    random root-to-leaf probes (Knuth's estimator), without walking the
+    entire value. Estimates treat shared subtrees as distinct.
+    """
+    if _is_node(value):
+        roots = [value]
+    elif isinstance(type(value), ADTMeta):
+        roots = []
+    else:
+        raise TypeError("%r is not an ADT value" % (value,))
+    if samples is None:
+        return _walk(roots)
+    return _estimate(roots, samples, Random(seed))
+
+
+def _is_node(obj) -> bool:
+    return getattr(type(obj), "_adt_", None) is not None
+
+
+def _measure(obj, seen: set[int], children: list) -> tuple[int, dict[str, int]]:
+    """
+    Measure a class member instance.
+
+    Returns its own size and the size of its fields' data, appending
+    class member instances it holds to `children`.
+    """
+    size = getsizeof(obj)
+    ns = getattr(obj, "__dict__", None)
+    if ns is not None:
+        size += getsizeof(ns)
+    payload = {}
+    for name, field_value in _field_values(obj):
+        payload[name] = _payload_size(field_value, seen, children)
+    return size, payload
+
+
+def _payload_size(obj, seen: set[int], children: list) -> int:
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if isinstance(type(obj), ADTMeta):
+            # a constant
+            continue
+        if _is_node(obj):
+            children.append(obj)
+            continue
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += getsizeof(obj)
+        if isinstance(obj, _CONTAINERS):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+    return size
+
+
+def _walk(stack: list) -> SizeReport:
+    variants: dict[type, int] = {}
+    fields: dict[tuple[type, str], int] = {}
+    nodes = 0
+    seen: set[int] = set()
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        nodes += 1
+        cls = type(node)
+        size, payload = _measure(node, seen, stack)
+        variants[cls] = variants.get(cls, 0) + size
+        for name, field_size in payload.items():
+            fields[cls, name] = fields.get((cls, name), 0) + field_size
+    total = sum(variants.values()) + sum(fields.values())
+    return SizeReport(total, variants, fields, nodes)
+
+
+def _estimate(roots: list, samples: int, rng: Random) -> SizeReport:
+    if samples < 1:
+        raise ValueError("samples must be positive")
+    variants: dict[type, float] = {}
+    fields: dict[tuple[type, str], float] = {}
+    nodes = 0.0
+    for _ in range(samples):
+        # every probe descends from the roots, picking one child at random
+        # at every level; the sizes along the path are weighted by the
+        # product of the branching factors seen so far
+        level = roots
+        weight = 1
+        while level:
+            weight *= len(level)
+            node = rng.choice(level)
+            cls = type(node)
+            level = []
+            size, payload = _measure(node, set(), level)
+            nodes += weight
+            variants[cls] = variants.get(cls, 0) + weight * size
+            for name, field_size in payload.items():
+                fields[cls, name] = fields.get((cls, name), 0) + weight * field_size
+    variants = {cls: round(size / samples) for cls, size in variants.items()}
+    fields = {key: round(size / samples) for key, size in fields.items()}
+    total = sum(variants.values()) + sum(fields.values())
+    return SizeReport(total, variants, fields, round(nodes / samples), True)
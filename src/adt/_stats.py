@@ -0,0 +1,92 @@
+"""Opt-in runtime statistics of ADT operations."""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+
+# The active recorders. Instrumented code paths check this list before doing
+# anything else, so recording costs a single truth test while disabled.
+recorders: list[StatsRecorder] = []
+
+_global_recorder: StatsRecorder | None = None
+
+
+@dataclass(frozen=True)
+class ADTStats:
+    """Counts of notable operations on a single ADT."""
+
+    #: By-value lookups of unhashable values, which scan all members.
+    linear_scans: int = 0
+    #: Calls to `_missing_` after a by-value lookup failed.
+    missing_calls: int = 0
+    #: `isinstance` checks not resolved by the class member fast path, not
+    #: counting the library's own checks.
+    instancecheck_fallbacks: int = 0
+    #: `in` checks against non-members, raising `TypeError`.
+    contains_errors: int = 0
+    #: Seconds spent creating the ADT class.
+    creation_time: float = 0.0
+
+
+class StatsRecorder:
+    """Collects statistics while active."""
+
+    def __init__(self) -> None:
+        self._stats: dict[type, dict[str, float]] = {}
+
+    def record(self, cls: type, event: str, amount: float = 1) -> None:
+        counts = self._stats.setdefault(cls, {})
+        counts[event] = counts.get(event, 0) + amount
+
+    def snapshot(self) -> dict[type, ADTStats]:
+        """Returns the statistics recorded so far, per ADT."""
+        return {cls: ADTStats(**counts) for cls, counts in self._stats.items()}
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+
+def record(cls: type, event: str, amount: float = 1) -> None:
+    for recorder in recorders:
+        recorder.record(cls, event, amount)
+
+
+@contextmanager
+def collect_stats() -> Iterator[StatsRecorder]:
+    """
+    Record statistics of ADT operations within the block.
+
+    Scopes may be nested; each recorder sees everything that happens while
+    it is active.
+    """
+    recorder = StatsRecorder()
+    recorders.append(recorder)
+    try:
+        yield recorder
+    finally:
+        recorders.remove(recorder)
+
+
+def enable_stats() -> None:
+    """Start recording statistics globally, until `disable_stats`."""
+    global _global_recorder
+    if _global_recorder is None:
+        _global_recorder = StatsRecorder()
+        recorders.append(_global_recorder)
+
+
+def disable_stats() -> None:
+    """Stop recording statistics globally, discarding them."""
+    global _global_recorder
+    if _global_recorder is not None:
+        recorders.remove(_global_recorder)
+        _global_recorder = None
+
+
+def stats_snapshot() -> dict[type, ADTStats]:
+    """Returns the globally recorded statistics, per ADT."""
+    if _global_recorder is None:
+        return {}
+    return _global_recorder.snapshot()
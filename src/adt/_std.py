@@ -0,0 +1,192 @@
+"""The standard Option and Result ADTs."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from . import ADT
+
+
+T = TypeVar("T")
+U = TypeVar("U")
+E = TypeVar("E")
+F = TypeVar("F")
+
+
+class Option(ADT[T]):
+    """
+    An optional value.
+
+    Either `Option.Some(val)` or `Option.NONE`. The methods are implemented
+    separately by both, so they do not branch on the member: those defined
+    here are the ones of `NONE`, and `Some` replaces `is_some`, `map`,
+    `and_then`, `unwrap`, `unwrap_or` and `__iter__` with the ones of
+    `_Some` below.
+    """
+
+    NONE = None
+
+    @dataclass(frozen=True)
+    class Some:
+        val: T
+
+    def is_some(self) -> bool:
+        return False
+
+    def map(self, fn: Callable[[T], U]) -> Option[U]:
+        return self
+
+    def and_then(self, fn: Callable[[T], Option[U]]) -> Option[U]:
+        return self
+
+    def unwrap(self) -> T:
+        raise ValueError("Option.NONE has no value")
+
+    def unwrap_or(self, default: T) -> T:
+        return default
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(())
+
+    @staticmethod
+    def collect(options: Iterable[Option[T]]) -> Option[list[T]]:
+        """
+        Returns `Some` of all the values, or `NONE` if any option is `NONE`.
+
+        The iterable is consumed in a single pass and stops at the first
+        `NONE`.
+        """
+        some = Option.Some
+        vals = []
+        append = vals.append
+        for option in options:
+            if option.__class__ is not some:
+                return option
+            append(option.val)
+        return some(vals)
+
+
+class Result(ADT[T, E]):
+    """
+    The result of an operation that may fail.
+
+    Either `Result.Ok(val)` or `Result.Err(err)`. `Ok` and `Err` each get
+    their own `is_ok`, `map`, `map_err`, `and_then`, `unwrap` and
+    `unwrap_or`, from `_Ok` and `_Err` below.
+    """
+
+    @dataclass(frozen=True)
+    class Ok:
+        val: T
+
+    @dataclass(frozen=True)
+    class Err:
+        err: E
+
+    @staticmethod
+    def collect(results: Iterable[Result[T, E]]) -> Result[list[T], E]:
+        """
+        Returns `Ok` of all the values, or the first `Err`.
+
+        The iterable is consumed in a single pass and stops at the first
+        `Err`.
+        """
+        ok = Result.Ok
+        vals = []
+        append = vals.append
+        for result in results:
+            if result.__class__ is not ok:
+                return result
+            append(result.val)
+        return ok(vals)
+
+    @staticmethod
+    def partition(results: Iterable[Result[T, E]]) -> tuple[list[T], list[E]]:
+        """
+        Splits the results into a list of values and a list of errors.
+
+        Both lists are built in a single pass over the iterable.
+        """
+        ok = Result.Ok
+        vals = []
+        errs = []
+        append_val = vals.append
+        append_err = errs.append
+        for result in results:
+            if result.__class__ is ok:
+                append_val(result.val)
+            else:
+                append_err(result.err)
+        return vals, errs
+
+
+# Methods on class members are replaced by the ADT's methods when the ADT is
+# created, so the members' own implementations are defined on these holder
+# classes and attached to the members afterwards.
+
+
+class _Some:
+    def is_some(self) -> bool:
+        return True
+
+    def map(self, fn: Callable[[T], U]) -> Option[U]:
+        return self.__class__(fn(self.val))
+
+    def and_then(self, fn: Callable[[T], Option[U]]) -> Option[U]:
+        return fn(self.val)
+
+    def unwrap(self) -> T:
+        return self.val
+
+    def unwrap_or(self, default: T) -> T:
+        return self.val
+
+    def __iter__(self) -> Iterator[T]:
+        return iter((self.val,))
+
+
+class _Ok:
+    def is_ok(self) -> bool:
+        return True
+
+    def map(self, fn: Callable[[T], U]) -> Result[U, E]:
+        return self.__class__(fn(self.val))
+
+    def map_err(self, fn: Callable[[E], F]) -> Result[T, F]:
+        return self
+
+    def and_then(self, fn: Callable[[T], Result[U, E]]) -> Result[U, E]:
+        return fn(self.val)
+
+    def unwrap(self) -> T:
+        return self.val
+
+    def unwrap_or(self, default: T) -> T:
+        return self.val
+
+
+class _Err:
+    def is_ok(self) -> bool:
+        return False
+
+    def map(self, fn: Callable[[T], U]) -> Result[U, E]:
+        return self
+
+    def map_err(self, fn: Callable[[E], F]) -> Result[T, F]:
+        return self.__class__(fn(self.err))
+
+    def and_then(self, fn: Callable[[T], Result[U, E]]) -> Result[U, E]:
+        return self
+
+    def unwrap(self) -> T:
+        raise ValueError("called unwrap on %r" % (self,))
+
+    def unwrap_or(self, default: T) -> T:
+        return default
+
+
+for _member, _methods in ((Option.Some, _Some), (Result.Ok, _Ok), (Result.Err, _Err)):
+    for _name, _method in vars(_methods).items():
+        if callable(_method):
+            setattr(_member, _name, _method)
+del _member, _methods, _name, _method
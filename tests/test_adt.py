@@ -50,6 +50,18 @@ def test_constructor() -> None:
         MyADT(Unrelated(1))
 
 
+def test_constant_after_class_member():
+    class Mixed(ADT):
+        @dataclass
+        class C:
+            x: int
+
+        A = 1
+
+    assert list(Mixed) == [Mixed.C, Mixed.A]
+    assert Mixed(1) is Mixed.A
+
+
 def test_isinstance():
     assert isinstance(MyADT.A, MyADT)
     assert isinstance(MyADT.C(1), MyADT)
@@ -59,3 +71,46 @@ def test_isinstance():
         x: int
 
     assert not isinstance(Unrelated(1), MyADT)
+
+
+def test_aliases():
+    class Aliased(ADT):
+        A = 1
+        B = 1
+        C = [1]
+        D = [1]
+
+    assert Aliased.B is Aliased.A
+    assert Aliased.D is Aliased.C
+    assert list(Aliased) == [Aliased.A, Aliased.C]
+
+
+def test_class_members_are_separate():
+    class Separate(ADT):
+        @dataclass
+        class C:
+            x: int
+
+        @dataclass
+        class R:
+            y: int
+
+        def method(self):
+            return 1
+
+    assert not hasattr(Separate.C, "R")
+    assert not hasattr(Separate.R, "C")
+    assert Separate.C(1).method() == 1
+
+
+def test_enum_methods_replace_member_methods():
+    class Described(ADT):
+        @dataclass
+        class C:
+            def describe(self):
+                return "member"
+
+        def describe(self):
+            return "adt"
+
+    assert Described.C().describe() == "adt"
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import copy
+
+from dataclasses import dataclass
+from typing import TypeVar
+
+from adt import ADT, Thunk, lazy
+
+
+T = TypeVar("T")
+
+
+class Tree(ADT[T]):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: T
+        left: Tree[T]
+        right: Tree[T]
+
+
+class Frozen(ADT):
+    EMPTY = "empty"
+
+    @dataclass(frozen=True)
+    class Node:
+        val: object
+        children: tuple[Frozen, ...] = ()
+
+
+class Graph(ADT):
+    @dataclass
+    class Vertex:
+        label: str
+        edges: list[Graph]
+
+
+class Rose(ADT):
+    @dataclass
+    class N:
+        children: dict[str, Rose]
+
+
+class Hashed(ADT):
+    @dataclass(frozen=True)
+    class Leaf:
+        val: object
+
+    @dataclass
+    class Bag:
+        items: set[Hashed]
+
+
+class Slotted(ADT):
+    @dataclass(frozen=True, slots=True)
+    class Pair:
+        a: object
+        b: object
+
+
+class Lazy(ADT):
+    @dataclass
+    class Node:
+        val: int = lazy()
+
+
+class Custom(ADT):
+    class Member:
+        def __init__(self, x):
+            self.x = x
+
+        def __deepcopy__(self, memo):
+            return "custom"
+
+
+def test_constants():
+    assert copy.copy(Tree.EMPTY) is Tree.EMPTY
+    assert copy.deepcopy(Tree.EMPTY) is Tree.EMPTY
+    assert copy.deepcopy([Tree.EMPTY])[0] is Tree.EMPTY
+
+
+def test_copy():
+    leaf = Tree.Node([1], Tree.EMPTY, Tree.EMPTY)
+    tree = Tree.Node(0, leaf, Tree.EMPTY)
+
+    shallow = copy.copy(tree)
+    assert shallow == tree and shallow is not tree
+    assert shallow.left is leaf
+
+    deep = copy.deepcopy(tree)
+    assert deep == tree
+    assert deep.left is not leaf
+    assert deep.left.val is not leaf.val
+    assert deep.right is Tree.EMPTY
+
+
+def test_deep():
+    tree = Tree.EMPTY
+    for i in range(100_000):
+        tree = Tree.Node(i, tree, Tree.EMPTY)
+
+    deep = copy.deepcopy(tree)
+    for _ in range(100_000):
+        assert deep is not tree and deep.val == tree.val
+        deep, tree = deep.left, tree.left
+    assert deep is Tree.EMPTY
+
+
+def test_shared():
+    shared = Tree.Node([1], Tree.EMPTY, Tree.EMPTY)
+    deep = copy.deepcopy(Tree.Node(0, shared, shared))
+
+    assert deep.left is deep.right
+    assert deep.left is not shared
+
+
+def test_memo():
+    shared = Tree.Node(1, Tree.EMPTY, Tree.EMPTY)
+    pair = copy.deepcopy([shared, Tree.Node(0, shared, Tree.EMPTY)])
+
+    assert pair[0] is pair[1].left
+    assert pair[0] is not shared
+
+
+def test_cycle():
+    a = Graph.Vertex("a", [])
+    b = Graph.Vertex("b", [a])
+    a.edges.append(b)
+
+    deep = copy.deepcopy(a)
+    assert deep is not a
+    assert deep.edges[0].label == "b"
+    assert deep.edges[0].edges[0] is deep
+
+
+def test_frozen():
+    leaf = Frozen.Node("leaf")
+    tree = Frozen.Node(1, (leaf, Frozen.EMPTY))
+    assert copy.deepcopy(tree) is tree
+
+    mutable = Frozen.Node(2, (Frozen.Node([1]), leaf))
+    deep = copy.deepcopy(mutable)
+    assert deep == mutable and deep is not mutable
+    assert deep.children[0] is not mutable.children[0]
+    assert deep.children[1] is leaf
+
+
+def test_frozen_cycle():
+    vertex = Graph.Vertex("a", [])
+    frozen = Frozen.Node(vertex)
+    vertex.edges.append(frozen)
+
+    deep = copy.deepcopy(vertex)
+    assert deep.edges[0] is not frozen
+    assert deep.edges[0].val is deep
+
+    deep = copy.deepcopy(frozen)
+    assert deep is not frozen
+    assert deep.val.edges[0] is deep
+
+
+def test_slots():
+    pair = Slotted.Pair([1], 2)
+    deep = copy.deepcopy(pair)
+    assert deep == pair and deep.a is not pair.a
+
+    unchanged = Slotted.Pair(1, 2)
+    assert copy.deepcopy(unchanged) is unchanged
+    assert copy.copy(unchanged) == unchanged
+
+
+def test_lazy():
+    calls = []
+    node = Lazy.Node(Thunk(lambda: calls.append(1) or len(calls)))
+
+    deep = copy.deepcopy(node)
+    assert calls == []
+    assert deep.val == 1
+    assert node.val == 2
+
+
+def test_custom():
+    assert copy.deepcopy(Custom.Member(1)) == "custom"
+    assert copy.copy(Custom.Member(1)).x == 1
+
+
+def test_dicts_and_sets():
+    shared = Rose.N({})
+    rose = Rose.N({})
+    for _ in range(3000):
+        rose = Rose.N({"k": rose, "shared": shared})
+
+    deep = copy.deepcopy(rose)
+    shared_copy = deep.children["shared"]
+    assert shared_copy is not shared
+    for _ in range(3000):
+        assert deep is not rose and deep.children is not rose.children
+        assert deep.children["shared"] is shared_copy
+        deep, rose = deep.children["k"], rose.children["k"]
+
+    leaf = Hashed.Leaf([1])
+    bag = Hashed.Bag({Hashed.Leaf(1), Hashed.Leaf((2,))})
+    deep = copy.deepcopy(bag)
+    assert deep == bag and deep.items is not bag.items
+    assert deep.items == bag.items
+    deep = copy.deepcopy(Hashed.Bag({"x"}))
+    assert deep.items == {"x"}
+    assert copy.deepcopy(leaf).val is not leaf.val
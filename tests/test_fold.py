@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from operator import add
+from typing import TypeVar
+
+import pytest
+
+from adt import ADT, Thunk, fold, lazy, parallel_fold
+
+
+T = TypeVar("T")
+
+
+class Tree(ADT[T]):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: T
+        left: Tree[T]
+        right: Tree[T]
+
+
+class Rose(ADT):
+    @dataclass
+    class Node:
+        label: str
+        children: list[Rose]
+
+
+class Lazy(ADT):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: int
+        next: Lazy = lazy()
+
+
+def build(lo: int, hi: int) -> Tree[int]:
+    if lo >= hi:
+        return Tree.EMPTY
+    mid = (lo + hi) // 2
+    return Tree.Node(mid, build(lo, mid), build(mid + 1, hi))
+
+
+def value(node) -> int:
+    match node:
+        case Tree.Node(val, _, _):
+            return val
+    return 0
+
+
+def label(node) -> str:
+    return node.label
+
+
+def test_fold():
+    assert fold(build(0, 100), value, add) == sum(range(100))
+    assert fold(Tree.EMPTY, value, add) == 0
+
+
+def test_order():
+    tree = Rose.Node("a", [Rose.Node("b", [Rose.Node("c", [])]), Rose.Node("d", [])])
+    assert fold(tree, label, add) == "abcd"
+
+
+def test_deep():
+    tree = Tree.EMPTY
+    for i in range(100_000):
+        tree = Tree.Node(i, tree, Tree.EMPTY)
+    assert fold(tree, value, add) == sum(range(100_000))
+
+
+def test_shared():
+    calls = []
+
+    def fn(node):
+        calls.append(node)
+        return value(node)
+
+    shared = build(0, 10)
+    tree = Tree.Node(100, shared, shared)
+
+    assert fold(tree, fn, add) == 100 + 2 * sum(range(10))
+    assert len(calls) == 12
+
+
+def test_lazy():
+    tree = Lazy.Node(1, Thunk(lambda: Lazy.Node(2, Thunk(lambda: Lazy.EMPTY))))
+    assert fold(tree, lambda n: getattr(n, "val", 0), add) == 3
+
+
+def test_cyclic():
+    nodes = [Rose.Node("a", []), Rose.Node("b", [])]
+    nodes[0].children.append(nodes[1])
+    nodes[1].children.append(nodes[0])
+
+    with pytest.raises(ValueError):
+        fold(nodes[0], label, add)
+    with pytest.raises(ValueError):
+        parallel_fold(nodes[0], label, add, threads=True)
+
+
+@pytest.mark.parametrize("threads", [False, True])
+@pytest.mark.parametrize("threshold", [None, 1, 7, 10_000])
+def test_parallel_fold(threads, threshold):
+    tree = build(0, 1000)
+    result = parallel_fold(
+        tree, value, add, threshold=threshold, max_workers=2, threads=threads
+    )
+    assert result == sum(range(1000))
+
+
+def test_parallel_order():
+    tree = Rose.Node("r", [Rose.Node(str(i), []) for i in range(1, 10)])
+    assert parallel_fold(tree, label, add, threshold=2, max_workers=2) == "r123456789"
+
+
+def test_parallel_shared():
+    shared = build(0, 100)
+    tree = Tree.Node(1000, Tree.Node(2000, shared, shared), shared)
+    result = parallel_fold(tree, value, add, threshold=10, threads=True)
+    assert result == 3000 + 3 * sum(range(100))
+
+
+def test_parallel_deep():
+    side = build(0, 100)
+    tree = Tree.EMPTY
+    for i in range(100_000):
+        tree = Tree.Node(i, tree, side)
+
+    result = parallel_fold(tree, value, add, max_workers=2)
+    assert result == sum(range(100_000)) + 100_000 * sum(range(100))
+
+
+def test_parallel_values():
+    # the workers see the same values, sharing included
+    shared = Rose.Node("s", [])
+    tree = Rose.Node("r", [Rose.Node("a", [shared, shared]), Rose.Node("b", [])])
+    result = parallel_fold(tree, rose_labels, add, threshold=3, max_workers=2)
+    assert result == ["r(2)", "a(2)", "s(0)", "s(0)", "b(0)"]
+
+
+def rose_labels(node) -> list[str]:
+    return [f"{node.label}({len(node.children)})"]
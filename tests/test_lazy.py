@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TypeVar
+
+import pytest
+
+from adt import ADT, Thunk, lazy
+
+
+T = TypeVar("T")
+
+
+class Tree(ADT[T], validate=True):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: T
+        left: Tree[T] = lazy()
+        right: Tree[T] = lazy()
+
+
+def counting_tree(depth: int, calls: list[int]) -> Tree[int]:
+    calls.append(depth)
+    if depth == 0:
+        return Tree.EMPTY
+    return Tree.Node(
+        depth,
+        Thunk(lambda: counting_tree(depth - 1, calls)),
+        Thunk(lambda: counting_tree(depth - 1, calls)),
+    )
+
+
+def test_evaluated_once():
+    calls = []
+    tree = counting_tree(50, calls)
+    assert calls == [50]
+
+    left = tree.left
+    assert calls == [50, 49]
+    assert tree.left is left
+    assert calls == [50, 49]
+
+
+def test_match():
+    calls = []
+    tree = counting_tree(3, calls)
+
+    match tree:
+        case Tree.Node(val, left):
+            assert val == 3
+            assert left.val == 2
+    # Only the destructured field is forced.
+    assert calls == [3, 2]
+
+
+def test_plain_values():
+    tree = Tree.Node(1, Tree.EMPTY, Tree.EMPTY)
+    assert tree.left is Tree.EMPTY
+    assert tree == Tree.Node(1, Thunk(lambda: Tree.EMPTY), Tree.EMPTY)
+
+
+def test_validation():
+    calls = []
+    tree = counting_tree(3, calls)
+
+    # Unevaluated fields are not forced by validation.
+    assert Tree[int](tree) is tree
+    assert calls == [3]
+
+    tree = Tree.Node(1, Thunk(lambda: 1), Tree.EMPTY)
+    Tree[int](tree)
+    tree.left
+    with pytest.raises(TypeError):
+        Tree[int](tree)
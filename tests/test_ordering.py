@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import bisect
+import gc
+import heapq
+import weakref
+
+from dataclasses import dataclass, field
+
+import pytest
+
+from adt import ADT
+
+
+class Event(ADT, ordered=True):
+    START = "start"
+
+    @dataclass
+    class Message:
+        priority: int
+        msg: str = field(compare=False)
+
+    @dataclass
+    class Nested:
+        inner: Event
+
+    STOP = "stop"
+
+
+def test_ordering():
+    values = [
+        Event.STOP,
+        Event.Nested(Event.STOP),
+        Event.Message(2, "b"),
+        Event.Nested(Event.Message(1, "a")),
+        Event.START,
+        Event.Message(1, "a"),
+    ]
+
+    assert sorted(values) == [
+        Event.START,
+        Event.Message(1, "a"),
+        Event.Message(2, "b"),
+        Event.Nested(Event.Message(1, "a")),
+        Event.Nested(Event.STOP),
+        Event.STOP,
+    ]
+    assert sorted(values, key=Event.sort_key) == sorted(values)
+    assert Event.START < Event.Message(0, "") <= Event.Message(0, "x") < Event.STOP
+    assert Event.STOP >= Event.STOP > Event.START
+
+
+def test_sort_keys():
+    assert Event.sort_key(Event.START) == (0,)
+    assert Event.sort_key(Event.Message(1, "a")) == (1, 1)
+    assert Event.sort_key(Event.Nested(Event.STOP)) == (2, (3,))
+    assert Event.sort_keys([Event.STOP, Event.START]) == [(3,), (0,)]
+
+
+def test_merge_and_bisect():
+    left = [Event.START, Event.Message(3, "c")]
+    right = [Event.Message(1, "a"), Event.STOP]
+
+    merged = list(heapq.merge(left, right, key=Event.sort_key))
+    assert merged == [
+        Event.START,
+        Event.Message(1, "a"),
+        Event.Message(3, "c"),
+        Event.STOP,
+    ]
+    keys = Event.sort_keys(merged)
+    assert bisect.bisect(keys, Event.sort_key(Event.Message(2, ""))) == 2
+
+
+def test_unordered():
+    class Unordered(ADT):
+        A = 1
+        B = 2
+
+    with pytest.raises(TypeError):
+        Unordered.A < Unordered.B
+    with pytest.raises(TypeError):
+        Event.START < 1
+    with pytest.raises(TypeError):
+        Unordered.sort_key(Unordered.A)
+    with pytest.raises(TypeError):
+        Unordered.sort_keys([Unordered.A])
+
+
+def test_sort_key_of_other_adt():
+    class Other(ADT, ordered=True):
+        A = 1
+
+    with pytest.raises(TypeError):
+        Event.sort_key(Other.A)
+    with pytest.raises(TypeError):
+        Event.sort_keys([Event.START, Other.A])
+    with pytest.raises(TypeError):
+        Event.sort_key(1)
+
+
+class Chain(ADT, ordered=True):
+    END = "end"
+
+    @dataclass
+    class Link:
+        val: int
+        next: Chain
+
+
+def test_deep():
+    chain = Chain.END
+    for i in range(10_000):
+        chain = Chain.Link(i, chain)
+
+    key = Chain.sort_key(chain)
+    for i in reversed(range(10_000)):
+        assert key[:2] == (1, i)
+        key = key[2]
+    assert key == (0,)
+    (keys,) = Chain.sort_keys([chain])
+    assert keys[:2] == (1, 9999)
+
+    # comparing keys recurses through the nested tuples
+    a = b = Chain.END
+    for i in range(200):
+        a = Chain.Link(i, a)
+        b = Chain.Link(i, b)
+    assert a <= b and not a < b
+    assert Chain.Link(-1, Chain.END) < a
+
+
+def test_freed():
+    class Temporary(ADT, ordered=True):
+        A = 1
+
+        @dataclass
+        class B:
+            x: int
+
+    assert Temporary.A < Temporary.B(1)
+    ref = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,121 @@
+import pickle
+import sys
+
+import pytest
+
+from adt import ADT, from_schema
+
+
+SCHEMA = {
+    "name": "Event",
+    "params": ["T"],
+    "options": {"ordered": True},
+    "members": [
+        {"name": "QUIT", "value": "quit"},
+        {
+            "name": "Message",
+            "fields": [
+                {"name": "msg", "type": "str"},
+                {"name": "payload", "type": "T | None", "default": None},
+            ],
+        },
+    ],
+}
+
+
+def check_event(event) -> None:
+    assert isinstance(event, type(ADT))
+    assert event("quit") is event.QUIT
+    assert event.Message("hi").payload is None
+    assert event.QUIT < event.Message("hi")
+    message = event.Message("hi", 1)
+    assert pickle.loads(pickle.dumps(message)) == message
+
+
+def test_in_memory():
+    module = from_schema(SCHEMA)
+
+    check_event(module.Event)
+    assert from_schema(SCHEMA) is module
+
+
+def test_cache(tmp_path):
+    schema = {**SCHEMA, "name": "CachedEvent"}
+    module = from_schema(schema, cache_dir=tmp_path)
+    check_event(module.CachedEvent)
+
+    (path,) = tmp_path.glob("*.py")
+    assert "class CachedEvent(ADT[T], ordered=True):" in path.read_text()
+
+    # A new process imports the cached module.
+    del sys.modules[module.__name__]
+    path.write_text(path.read_text().replace("quit", "leave"))
+    module = from_schema(schema, cache_dir=tmp_path)
+    assert module.CachedEvent.QUIT.value == "leave"
+
+
+def test_multiple():
+    module = from_schema(
+        [
+            {"name": "A", "members": [{"name": "X", "value": 1}]},
+            {
+                "name": "B",
+                "members": [{"name": "Y", "fields": [{"name": "a", "type": "A"}]}],
+            },
+        ]
+    )
+
+    assert module.B.Y(module.A.X).a is module.A.X
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"name": "class", "members": []},
+        {"name": "A", "members": [{"name": "X", "value": object()}]},
+        {"name": "A", "members": [{"name": "X", "value": (1, 2)}]},
+        {"name": "A", "members": [{"name": "X", "value": {1: 2}}]},
+        {"name": "A", "options": {"mixin": True}, "members": []},
+        {
+            "name": "A",
+            "members": [
+                {"name": "Y", "fields": [{"name": "a", "type": "__import__('os')"}]}
+            ],
+        },
+        {
+            "name": "A",
+            "members": [
+                {
+                    "name": "Y",
+                    "fields": [
+                        {"name": "a", "type": "int", "default": 1},
+                        {"name": "b", "type": "int"},
+                    ],
+                }
+            ],
+        },
+    ],
+)
+def test_invalid(schema):
+    with pytest.raises((ValueError, TypeError)):
+        from_schema(schema)
+
+
+def test_members():
+    module = from_schema(
+        {
+            "name": "Shape",
+            "members": [
+                {"name": "Point", "fields": []},
+                {"name": "Circle", "fields": [{"name": "r", "type": "float"}]},
+            ],
+        }
+    )
+    shape = module.Shape
+
+    assert shape.Point() == shape.Point()
+    assert shape.Circle(1.0) == shape.Circle(r=1.0) != shape.Circle(2.0)
+    assert repr(shape.Circle(1.0)) == "Shape.Circle(r=1.0)"
+    match shape.Circle(1.0):
+        case shape.Circle(r):
+            assert r == 1.0
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from sys import getsizeof
+from typing import TypeVar
+
+import pytest
+
+from adt import ADT, Thunk, lazy, sizeof
+
+
+T = TypeVar("T")
+
+
+class Tree(ADT[T]):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: T
+        left: Tree[T]
+        right: Tree[T] = lazy()
+
+
+def node_size(node) -> int:
+    return getsizeof(node) + getsizeof(node.__dict__)
+
+
+def test_constant():
+    assert sizeof(Tree.EMPTY).total == 0
+
+    with pytest.raises(TypeError):
+        sizeof(1)
+
+
+def test_breakdown():
+    leaf = Tree.Node([1000, 2000], Tree.EMPTY, Tree.EMPTY)
+    report = sizeof(Tree.Node("a", leaf, Tree.EMPTY))
+
+    assert report.nodes == 2
+    assert report.variants == {Tree.Node: 2 * node_size(leaf)}
+    assert report.fields[Tree.Node, "val"] == sum(
+        map(getsizeof, ["a", [1000, 2000], 1000, 2000])
+    )
+    assert report.fields[Tree.Node, "left"] == 0
+    assert report.total == sum(report.variants.values()) + sum(report.fields.values())
+
+
+def test_sharing():
+    leaf = Tree.Node(1000, Tree.EMPTY, Tree.EMPTY)
+    shared = sizeof(Tree.Node(1000, leaf, leaf))
+    distinct = sizeof(Tree.Node(1000, leaf, Tree.Node(1000, Tree.EMPTY, Tree.EMPTY)))
+
+    assert shared.nodes == 2
+    assert distinct.nodes == 3
+
+
+def test_deep():
+    tree = Tree.EMPTY
+    for i in range(100_000):
+        tree = Tree.Node(i, tree, Tree.EMPTY)
+
+    assert sizeof(tree).nodes == 100_000
+
+
+def test_lazy_not_forced():
+    calls = []
+    tree = Tree.Node(1, Tree.EMPTY, Thunk(lambda: calls.append(1)))
+
+    assert sizeof(tree).nodes == 1
+    assert calls == []
+
+
+def test_sampling():
+    def full(depth: int) -> Tree[int]:
+        if depth == 0:
+            return Tree.EMPTY
+        return Tree.Node(1000, full(depth - 1), full(depth - 1))
+
+    tree = full(10)
+    exact = sizeof(tree)
+    estimate = sizeof(tree, samples=10, seed=0)
+
+    # Every probe of a complete tree estimates it exactly, except for
+    # values shared between nodes.
+    assert estimate.estimated
+    assert estimate.nodes == exact.nodes
+    assert estimate.variants == exact.variants
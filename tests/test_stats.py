@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+
+import pytest
+
+from adt import (
+    ADT,
+    ADTStats,
+    collect_stats,
+    disable_stats,
+    enable_stats,
+    stats_snapshot,
+)
+
+
+class Unhashable(ADT):
+    A = [1]
+    B = [2]
+
+    @dataclass
+    class C:
+        x: int
+
+    @classmethod
+    def _missing_(cls, value):
+        return None
+
+
+def test_disabled():
+    Unhashable([1])
+    assert stats_snapshot() == {}
+
+
+def test_events():
+    with collect_stats() as recorder:
+        assert Unhashable([2]) is Unhashable.B
+        with pytest.raises(ValueError):
+            Unhashable(3)
+        assert isinstance(Unhashable.A, Unhashable)
+        assert isinstance(Unhashable.C(1), Unhashable)
+        assert not isinstance(1, Unhashable)
+        assert not isinstance(1, ADT)
+        with pytest.warns(DeprecationWarning), pytest.raises(TypeError):
+            1 in Unhashable
+
+    snapshot = recorder.snapshot()
+    assert snapshot[Unhashable] == ADTStats(
+        linear_scans=1,
+        missing_calls=1,
+        instancecheck_fallbacks=1,
+        contains_errors=1,
+    )
+    # only the user's check falls back; the library's own checks do not count
+    assert snapshot[ADT] == ADTStats(instancecheck_fallbacks=1)
+
+
+def test_nested_scopes():
+    with collect_stats() as outer:
+        Unhashable([1])
+        with collect_stats() as inner:
+            Unhashable([1])
+
+    assert outer.snapshot()[Unhashable].linear_scans == 2
+    assert inner.snapshot()[Unhashable].linear_scans == 1
+
+
+def test_creation_time():
+    enable_stats()
+    try:
+
+        class Timed(ADT):
+            A = 1
+
+        assert stats_snapshot()[Timed].creation_time > 0
+    finally:
+        disable_stats()
+    assert stats_snapshot() == {}
@@ -0,0 +1,70 @@
+import pickle
+
+import pytest
+
+from adt import Option, Result
+
+
+def test_option():
+    assert Option(None) is Option.NONE
+    assert Option.Some(1).map(lambda x: x + 1) == Option.Some(2)
+    assert Option.NONE.map(lambda x: x + 1) is Option.NONE
+    assert Option.Some(1).and_then(lambda _: Option.NONE) is Option.NONE
+    assert Option.NONE.and_then(lambda x: Option.Some(x)) is Option.NONE
+    assert Option.Some(1).unwrap_or(2) == 1
+    assert Option.NONE.unwrap_or(2) == 2
+    assert Option.Some(1).is_some()
+    assert not Option.NONE.is_some()
+    assert list(Option.Some(1)) == [1]
+    assert list(Option.NONE) == []
+
+    with pytest.raises(ValueError):
+        Option.NONE.unwrap()
+
+
+def test_member_methods():
+    # each member has its own implementations instead of branching
+    for name in ("is_some", "map", "and_then", "unwrap", "unwrap_or", "__iter__"):
+        assert getattr(Option.Some, name) is not getattr(Option, name)
+    for name in ("is_ok", "map", "map_err", "and_then", "unwrap", "unwrap_or"):
+        assert getattr(Result.Ok, name) is not getattr(Result.Err, name)
+
+
+def test_option_collect():
+    assert Option.collect([Option.Some(1), Option.Some(2)]) == Option.Some([1, 2])
+    assert Option.collect([Option.Some(1), Option.NONE]) is Option.NONE
+    assert Option.collect([]) == Option.Some([])
+
+
+def test_result():
+    assert Result.Ok(1).map(lambda x: x + 1) == Result.Ok(2)
+    assert Result.Err("e").map(lambda x: x + 1) == Result.Err("e")
+    assert Result.Err("e").map_err(str.upper) == Result.Err("E")
+    assert Result.Ok(1).and_then(lambda x: Result.Err(x)) == Result.Err(1)
+    assert Result.Ok(1).unwrap_or(2) == 1
+    assert Result.Err("e").unwrap_or(2) == 2
+    assert isinstance(Result.Ok(1), Result)
+
+    with pytest.raises(ValueError):
+        Result.Err("e").unwrap()
+
+
+def test_result_collections():
+    results = [Result.Ok(1), Result.Err("a"), Result.Ok(2), Result.Err("b")]
+
+    assert Result.collect(iter(results[::2])) == Result.Ok([1, 2])
+    assert Result.collect(iter(results)) == Result.Err("a")
+    assert Result.partition(iter(results)) == ([1, 2], ["a", "b"])
+
+
+def test_match():
+    match Result.Ok(1):
+        case Result.Ok(val):
+            assert val == 1
+        case _:
+            assert False
+
+
+def test_pickle():
+    assert pickle.loads(pickle.dumps(Option.NONE)) is Option.NONE
+    assert pickle.loads(pickle.dumps(Result.Ok(1))) == Result.Ok(1)
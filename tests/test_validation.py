@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import threading
+
+from dataclasses import dataclass
+from typing import Optional, TypeVar
+
+import pytest
+
+import adt
+
+from adt import ADT
+
+
+T = TypeVar("T")
+
+
+class Tree(ADT[T], validate=True):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        val: T
+        left: Tree[T]
+        right: Tree[T]
+
+
+class Option(ADT[T], validate=True):
+    NONE = None
+
+    @dataclass
+    class Some:
+        val: T
+        hint: Optional[str] = None
+
+
+class Outer(ADT[T], validate=True):
+    @dataclass
+    class Node:
+        inner: Inner[T]
+
+
+class Inner(ADT[T], validate=True):
+    EMPTY = "empty"
+
+    @dataclass
+    class Node:
+        outer: Outer[T]
+
+
+def test_constructor():
+    assert Option[int].Some(1) == Option.Some(1)
+    assert Option[int].NONE is Option.NONE
+    assert isinstance(Option[int].Some(1), Option[int].Some)
+
+    with pytest.raises(TypeError):
+        Option[int].Some("x")
+    with pytest.raises(TypeError):
+        Option[int].Some(1, 1)
+
+    # Unparametrized constructors do not check.
+    assert Option.Some("x").val == "x"
+
+
+def test_numeric_promotion():
+    assert Option[float].Some(1).val == 1
+    assert Option[complex].Some(1.5).val == 1.5
+    with pytest.raises(TypeError):
+        Option[int].Some(1.5)
+
+
+def test_shallow_recursive():
+    with pytest.raises(TypeError):
+        Tree[int].Node(1, 2, Tree.EMPTY)
+
+    # The children are not validated by the constructor.
+    Tree[int].Node(1, Tree.Node("x", Tree.EMPTY, Tree.EMPTY), Tree.EMPTY)
+
+
+def test_deep():
+    tree = Tree.EMPTY
+    for i in range(10_000):
+        tree = Tree.Node(i, tree, Tree.EMPTY)
+
+    assert Tree[int](tree) is tree
+    assert Tree[int](Tree.EMPTY) is Tree.EMPTY
+    with pytest.raises(TypeError):
+        Tree[str](tree)
+
+
+def test_checker_cache():
+    assert Tree._checker_((int,)) is Tree._checker_((int,))
+    assert Tree[int].Node is Tree[int].Node
+    assert Tree[int].Node is not Tree[str].Node
+
+
+def test_checker_failure(monkeypatch):
+    compile_checker = adt._compile_checker
+
+    def failing(cls, variant, subst):
+        check = compile_checker(cls, variant, subst)
+        if cls is Outer:
+            raise RuntimeError
+        return check
+
+    monkeypatch.setattr(adt, "_compile_checker", failing)
+    with pytest.raises(RuntimeError):
+        Outer[int].Node
+    # Inner[int] was compiled in the meantime, referring to Outer[int]
+    assert (int,) not in Outer._checkers_
+    assert (int,) not in Inner._checkers_
+
+    monkeypatch.undo()
+    value = Inner[int].Node(Outer[int].Node(Inner.EMPTY))
+    assert Inner[int](value) is value
+
+
+def test_concurrent_compilation(monkeypatch):
+    compile_checker = adt._compile_checker
+    compiling = threading.Event()
+    release = threading.Event()
+
+    def slow(cls, variant, subst):
+        compiling.set()
+        release.wait()
+        return compile_checker(cls, variant, subst)
+
+    class Chain(ADT[T], validate=True):
+        EMPTY = "empty"
+
+        @dataclass
+        class Node:
+            val: T
+            next: Chain[T]
+
+    monkeypatch.setattr(adt, "_compile_checker", slow)
+    thread = threading.Thread(target=lambda: Chain[int].Node, daemon=True)
+    thread.start()
+    compiling.wait()
+    errors = []
+
+    def validate():
+        try:
+            Chain[int](Chain.Node("x", Chain.EMPTY))
+        except TypeError as e:
+            errors.append(e)
+
+    validating = threading.Thread(target=validate, daemon=True)
+    try:
+        # the table being compiled is not visible yet
+        assert (int,) not in Chain._checkers_
+        validating.start()
+    finally:
+        release.set()
+    thread.join()
+    validating.join()
+    assert len(errors) == 1